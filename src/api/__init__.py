@@ -2,16 +2,28 @@
 API client package for ACM-OJ.
 """
 
-from .base import BaseAPIClient
-from .course import CourseClient
-from .problem import ProblemClient
-from .submission import SubmissionClient
-from .user import UserClient
+import importlib
 
-__all__ = [
-    "BaseAPIClient",
-    "CourseClient",
-    "ProblemClient",
-    "SubmissionClient",
-    "UserClient",
-]
+# Public names mapped to the submodules that define them. Resolved lazily
+# through __getattr__ (PEP 562) so importing the package — which happens
+# as soon as APIClient pulls helpers from .api.base — does not drag in
+# every sub-client module and the pydantic models behind them.
+_SUBMODULES = {
+    "BaseAPIClient": ".base",
+    "CourseClient": ".course",
+    "ProblemClient": ".problem",
+    "SubmissionClient": ".submission",
+    "UserClient": ".user",
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so the next access skips __getattr__
+    globals()[name] = value
+    return value
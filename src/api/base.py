@@ -2,22 +2,143 @@
 Base API client functionality.
 """
 
+import functools
+import logging
+import re
+import threading
+from concurrent.futures import Future
 from typing import Dict, Generic, Optional, TypeVar
 
 import requests
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .. import __version__
 from ..config import Config
+from .cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=None)
+def _adapter(model) -> TypeAdapter:
+    """
+    Return a cached TypeAdapter for a model type.
+
+    Building a TypeAdapter compiles the validation schema; caching one per
+    type means repeated responses reuse it instead of traversing the schema
+    graph again.
+
+    Args:
+        model: Model type to validate against
+
+    Returns:
+        TypeAdapter: Shared adapter for the type
+    """
+    return TypeAdapter(model)
+
+
+_CURSOR_RE = re.compile(r"[?&]cursor=([^&#]+)")
+
+
+def _extract_cursor(next_url: Optional[str]) -> Optional[str]:
+    """
+    Extract the pagination cursor from a 'next' page URL.
+
+    Args:
+        next_url: The 'next' field of a paginated response, or None
+
+    Returns:
+        Optional[str]: Cursor value, or None when there is no next page
+    """
+    if not next_url:
+        return None
+    match = _CURSOR_RE.search(next_url)
+    return match.group(1) if match else None
+
+
+def _accept_encoding() -> str:
+    """
+    Build the Accept-Encoding header value.
+
+    Brotli shaves 20-30% off large list payloads versus gzip, but urllib3
+    can only decode it when a brotli implementation is installed, so it is
+    only advertised when one is importable.
+
+    Returns:
+        str: Accept-Encoding header value
+    """
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+            return "br, gzip, deflate"
+        except ImportError:
+            continue
+    return "gzip, deflate"
+
+
+def _build_adapter() -> HTTPAdapter:
+    """
+    Build the HTTP adapter shared by all API requests.
+
+    The CLI fires many sequential calls against a single host, so a tuned
+    connection pool keeps TLS connections alive between requests, and the
+    retry policy transparently handles transient server errors and
+    rate limiting.
+
+    Returns:
+        HTTPAdapter: Adapter with pooling and retry policy configured
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+    )
+    return HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+
+
+def _response_from_cache(url: str, body: bytes) -> requests.Response:
+    """
+    Wrap a cached body in a requests.Response.
+
+    Args:
+        url: URL the body was originally fetched from
+        body: Cached response bytes
+
+    Returns:
+        requests.Response: Synthetic 200 response carrying the cached body
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    return response
+
+
 class BaseAPIClient(Generic[T]):
     """Base class for API clients with common functionality."""
 
+    #: API root shared by every sub-client; a class attribute so it is
+    #: stored once and readable without constructing a client.
+    base_url = "https://acm.sjtu.edu.cn/OnlineJudge/api/v1"
+
+    #: Resource path under the API root (e.g. "problem/"). Sub-clients set
+    #: this so their URL prefix is formatted once at construction instead
+    #: of on every request.
+    _resource_path: Optional[str] = None
+
     def __init__(
         self,
         session: Optional[requests.Session] = None,
         config: Optional[Config] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize base client.
@@ -25,32 +146,51 @@ class BaseAPIClient(Generic[T]):
         Args:
             session: Optional requests session to use
             config: Optional configuration instance
+            cache: Optional response cache for GET endpoints
         """
-        self.base_url = "https://acm.sjtu.edu.cn/OnlineJudge/api/v1"
+        self.cache = cache
+        self.logger = logging.getLogger(__name__)
+        # When a session is passed in, its owner (APIClient) is responsible
+        # for adapter mounting and header management; mounting here as well
+        # would clobber the shared connection pool.
+        self._shared_session = session is not None
         self.session = session or requests.Session()
         self.config = config or Config()
+        self._resource_url = (
+            f"{self.base_url}/{self._resource_path}" if self._resource_path else None
+        )
+        # Map of in-flight GETs so concurrent identical requests (e.g. from
+        # gather()) share one network round trip.
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        if not self._shared_session:
+            self.session.mount("https://", _build_adapter())
+            self.session.headers.update(
+                {
+                    "Connection": "keep-alive",
+                    "User-Agent": f"termoj/{__version__}",
+                    "Accept-Encoding": _accept_encoding(),
+                }
+            )
 
         # Load token if available
         self.token = self.config.token
-        if self.token:
+        if self.token and not self._shared_session:
             self.session.headers.update({"Authorization": f"Bearer {self.token}"})
 
-    def _handle_response(self, response: requests.Response) -> T:
+    def _check_response(self, response: requests.Response) -> None:
         """
-        Handle API response and raise appropriate exceptions.
+        Raise an APIException for error status codes.
 
         Args:
             response: Response from API request
 
-        Returns:
-            Dict: Parsed JSON response
-
         Raises:
-            APIException: If request fails or returns error status
+            APIException: If the response carries an error status
         """
         try:
             response.raise_for_status()
-            return response.json()
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
                 raise APIException(
@@ -64,6 +204,167 @@ class BaseAPIClient(Generic[T]):
             else:
                 raise APIException(f"API request failed: {str(e)}", response)
 
+    def _handle_response(self, response: requests.Response) -> T:
+        """
+        Handle API response and raise appropriate exceptions.
+
+        Args:
+            response: Response from API request
+
+        Returns:
+            Dict: Parsed JSON response
+
+        Raises:
+            APIException: If request fails or returns error status
+        """
+        self._check_response(response)
+        # orjson parses the raw bytes ~2-3x faster than stdlib json on
+        # the list endpoints, where payload parsing dominates.
+        if orjson is not None and isinstance(response.content, bytes):
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _handle_model_response(self, response: requests.Response, model):
+        """
+        Handle an API response that maps onto a single pydantic model.
+
+        Validates the raw response bytes directly with pydantic-core's JSON
+        parser, skipping the intermediate dict that response.json() would
+        materialize.
+
+        Args:
+            response: Response from API request
+            model: Pydantic model class to validate against
+
+        Returns:
+            The validated model instance
+
+        Raises:
+            APIException: If request fails or returns error status
+        """
+        self._check_response(response)
+        adapter = _adapter(model)
+        if isinstance(response.content, (bytes, bytearray)):
+            return adapter.validate_json(response.content)
+        return adapter.validate_python(response.json())
+
+    def _get_coalesced(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> requests.Response:
+        """
+        Perform a GET request, deduplicating concurrent identical requests.
+
+        If the same URL and parameters are already being fetched on another
+        thread, wait for that response instead of issuing a duplicate.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            headers: Optional extra request headers
+
+        Returns:
+            requests.Response: Response shared by all coalesced callers
+        """
+        key = (url, tuple(sorted(params.items())) if params else None)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                is_owner = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                is_owner = True
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            kwargs = {}
+            if params is not None:
+                kwargs["params"] = params
+            if headers is not None:
+                kwargs["headers"] = headers
+            response = self.session.get(url, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _cached_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        ttl: Optional[float] = None,
+    ) -> requests.Response:
+        """
+        Perform a GET request through the response cache when one is set.
+
+        On a fresh cache hit the stored body is wrapped in a synthetic
+        response so callers can keep using the normal response handling.
+        When the network is unreachable, a previously cached body is served
+        regardless of age instead of failing outright.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            ttl: Cache freshness window in seconds; None bypasses the cache
+
+        Returns:
+            requests.Response: Live or cache-backed response
+        """
+        if self.cache is None or ttl is None:
+            return self._get_coalesced(url, params)
+
+        key = ResponseCache.make_key(url, params)
+        body = self.cache.get(key, max_age=ttl)
+        if body is not None:
+            return _response_from_cache(url, body)
+
+        # An expired entry may still be current: send its validators so the
+        # server can answer 304 with no body instead of a full transfer.
+        stale = self.cache.get_stale(key)
+        validators = {}
+        if stale is not None:
+            _, etag, last_modified = stale
+            if etag:
+                validators["If-None-Match"] = etag
+            if last_modified:
+                validators["If-Modified-Since"] = last_modified
+
+        try:
+            response = self._get_coalesced(url, params, headers=validators or None)
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ):
+            if self.config.serve_stale_on_error and stale is not None:
+                self.logger.warning(
+                    "API unreachable, serving stale cached data for %s", url
+                )
+                return _response_from_cache(url, stale[0])
+            raise
+
+        if response.status_code == 304 and stale is not None:
+            self.cache.touch(key)
+            return _response_from_cache(url, stale[0])
+
+        if response.status_code == 200 and isinstance(response.content, bytes):
+            self.cache.set(
+                key,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return response
+
     def set_token(self, token: str):
         """
         Set authentication token.
@@ -72,6 +373,10 @@ class BaseAPIClient(Generic[T]):
             token: Personal access token from ACM-OJ
         """
         self.token = token
+        if self._shared_session:
+            # The shared-session owner persists the token and writes the
+            # Authorization header exactly once for all sub-clients.
+            return
         self.config.token = token
         self.session.headers.update({"Authorization": f"Bearer {token}"})
 
@@ -0,0 +1,154 @@
+"""
+Local response cache for API GET requests.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+
+# Bump when the table layout changes; mismatched stores are rebuilt.
+_SCHEMA_VERSION = 1
+
+
+class ResponseCache:
+    """SQLite-backed cache for raw API response bodies.
+
+    Problem statements and course metadata change rarely, so repeated CLI
+    invocations can serve them locally instead of paying a network round
+    trip. Entries store the raw response bytes; freshness is decided at
+    read time by the caller-supplied TTL, which lets each endpoint pick
+    its own expiry without duplicating entries. HTTP validators (ETag and
+    Last-Modified) are kept alongside the body so expired entries can be
+    revalidated with a cheap conditional GET instead of a full transfer.
+    """
+
+    def __init__(self, cache_file: Path):
+        """
+        Initialize the cache store.
+
+        Args:
+            cache_file: Path of the SQLite database file
+        """
+        cache_file.parent.mkdir(exist_ok=True)
+        # gather() and the list-command prefetch worker hit the cache from
+        # executor threads, so the connection must be shareable; a lock
+        # serializes statements since sqlite3 objects are not thread-safe.
+        self._conn = sqlite3.connect(str(cache_file), check_same_thread=False)
+        self._lock = threading.Lock()
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "body BLOB NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """
+        Build a cache key from a URL and its query parameters.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+
+        Returns:
+            str: Canonical key with parameters in sorted order
+        """
+        if params:
+            return f"{url}?{urlencode(sorted(params.items()))}"
+        return url
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+        """
+        Look up a cached response body.
+
+        Args:
+            key: Cache key from make_key
+            max_age: Maximum entry age in seconds; None means no expiry
+
+        Returns:
+            Optional[bytes]: Cached body, or None on miss/expiry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, created_at = row
+        if max_age is not None and time.time() - created_at > max_age:
+            return None
+        return body
+
+    def get_stale(
+        self, key: str
+    ) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
+        """
+        Look up an entry regardless of age, including its HTTP validators.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[Tuple]: (body, etag, last_modified), or None on miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return row
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response body with its HTTP validators.
+
+        Args:
+            key: Cache key from make_key
+            body: Raw response bytes
+            etag: Optional ETag response header
+            last_modified: Optional Last-Modified response header
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, created_at, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                (key, body, time.time(), etag, last_modified),
+            )
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """
+        Mark an entry as fresh again after a successful revalidation.
+
+        Args:
+            key: Cache key from make_key
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET created_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
@@ -3,15 +3,23 @@ Course-specific API client.
 """
 
 from typing import List, Optional, Tuple, Union
-from urllib.parse import parse_qs, urlparse
+
+from pydantic import TypeAdapter
 
 from ..models import Course, Problemset
-from .base import APIException, BaseAPIClient
+from .base import APIException, BaseAPIClient, _extract_cursor
+
+# Instantiated once so list validation reuses the compiled schema instead of
+# re-entering the per-item validator for every element.
+_COURSE_LIST_ADAPTER = TypeAdapter(List[Course])
+_PROBLEMSET_LIST_ADAPTER = TypeAdapter(List[Problemset])
 
 
 class CourseClient(BaseAPIClient[Union[Course, List[Course], List[Problemset]]]):
     """Client for course-related API endpoints."""
 
+    _resource_path = "course/"
+
     def get_courses(
         self,
         keyword: Optional[str] = None,
@@ -41,16 +49,13 @@ class CourseClient(BaseAPIClient[Union[Course, List[Course], List[Problemset]]])
         if cursor:
             params["cursor"] = cursor
 
-        response = self.session.get(f"{self.base_url}/course/", params=params)
+        # Short TTL: listings change as courses are published.
+        response = self._cached_get(self._resource_url, params=params, ttl=30)
         data = self._handle_response(response)
-        courses = [Course(**course) for course in data.get("courses", [])]
+        courses = _COURSE_LIST_ADAPTER.validate_python(data.get("courses", []))
 
         # Extract cursor from 'next' query param
-        next_cursor = None
-        if data.get("next"):
-            parsed_url = urlparse(data["next"])
-            query_params = parse_qs(parsed_url.query)
-            next_cursor = query_params.get("cursor", [None])[0]
+        next_cursor = _extract_cursor(data.get("next"))
 
         return courses, next_cursor
 
@@ -64,9 +69,9 @@ class CourseClient(BaseAPIClient[Union[Course, List[Course], List[Problemset]]])
         Returns:
             Course: Course details including name, description, etc.
         """
-        response = self.session.get(f"{self.base_url}/course/{course_id}")
-        data = self._handle_response(response)
-        return Course(**data)
+        # Course metadata changes rarely within a term.
+        response = self._cached_get(self._resource_url + str(course_id), ttl=1800)
+        return self._handle_model_response(response, Course)
 
     def join_course(self, course_id: int) -> None:
         """
@@ -75,7 +80,7 @@ class CourseClient(BaseAPIClient[Union[Course, List[Course], List[Problemset]]])
         Args:
             course_id: ID of the course to join
         """
-        response = self.session.post(f"{self.base_url}/course/{course_id}/join")
+        response = self.session.post(f"{self._resource_url}{course_id}/join")
 
         if response.status_code == 204:
             # Success with no content
@@ -95,7 +100,7 @@ class CourseClient(BaseAPIClient[Union[Course, List[Course], List[Problemset]]])
         Args:
             course_id: ID of the course to quit
         """
-        response = self.session.post(f"{self.base_url}/course/{course_id}/quit")
+        response = self.session.post(f"{self._resource_url}{course_id}/quit")
         self._handle_response(response)
 
     def get_course_problemsets(self, course_id: int) -> List[Problemset]:
@@ -108,6 +113,8 @@ class CourseClient(BaseAPIClient[Union[Course, List[Course], List[Problemset]]])
         Returns:
             List[Problemset]: List of problemset details
         """
-        response = self.session.get(f"{self.base_url}/course/{course_id}/problemsets")
+        response = self._cached_get(
+            f"{self._resource_url}{course_id}/problemsets", ttl=300
+        )
         data = self._handle_response(response)
-        return [Problemset(**problemset) for problemset in data.get("problemsets", [])]
+        return _PROBLEMSET_LIST_ADAPTER.validate_python(data.get("problemsets", []))
@@ -2,15 +2,23 @@
 Problem-specific API client.
 """
 
-from typing import List, Literal, Optional, Union
+from typing import Iterator, List, Literal, Optional, Union
+
+from pydantic import TypeAdapter
 
 from ..models import Problem, ProblemBrief, Submission
-from .base import BaseAPIClient
+from .base import BaseAPIClient, _extract_cursor
+
+# Instantiated once so list validation reuses the compiled schema instead of
+# re-entering the per-item validator for every element.
+_PROBLEM_BRIEF_LIST_ADAPTER = TypeAdapter(List[ProblemBrief])
 
 
 class ProblemClient(BaseAPIClient[Union[Problem, List[ProblemBrief], Submission]]):
     """Client for problem-related API endpoints."""
 
+    _resource_path = "problem/"
+
     def get_problems(
         self,
         keyword: Optional[str] = None,
@@ -34,9 +42,49 @@ class ProblemClient(BaseAPIClient[Union[Problem, List[ProblemBrief], Submission]
         if cursor:
             params["cursor"] = cursor
 
-        response = self.session.get(f"{self.base_url}/problem/", params=params)
+        # Short TTL: listings change as problems are published.
+        response = self._cached_get(self._resource_url, params=params, ttl=30)
         data = self._handle_response(response)
-        return [ProblemBrief(**problem) for problem in data.get("problems", [])]
+        return _PROBLEM_BRIEF_LIST_ADAPTER.validate_python(data.get("problems", []))
+
+    def iter_problems(
+        self,
+        keyword: Optional[str] = None,
+        problemset_id: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> Iterator[ProblemBrief]:
+        """
+        Iterate over problems across all pages.
+
+        Pages are fetched lazily, so consumers that stop early (e.g. after
+        the first N matches) never pay for the remaining pages.
+
+        Args:
+            keyword: Optional search keyword to filter problems
+            problemset_id: Optional problemset ID to filter problems
+            cursor: Optional pagination cursor to start from
+
+        Yields:
+            ProblemBrief: Problem briefs in listing order
+        """
+        while True:
+            params = {}
+            if keyword:
+                params["keyword"] = keyword
+            if problemset_id:
+                params["problemset_id"] = problemset_id
+            if cursor:
+                params["cursor"] = cursor
+
+            response = self._cached_get(self._resource_url, params=params, ttl=30)
+            data = self._handle_response(response)
+            yield from _PROBLEM_BRIEF_LIST_ADAPTER.validate_python(
+                data.get("problems", [])
+            )
+
+            cursor = _extract_cursor(data.get("next"))
+            if not cursor:
+                return
 
     def get_problem(self, problem_id: int) -> Problem:
         """
@@ -48,9 +96,9 @@ class ProblemClient(BaseAPIClient[Union[Problem, List[ProblemBrief], Submission]
         Returns:
             Problem: Problem details including description, input/output format, etc.
         """
-        response = self.session.get(f"{self.base_url}/problem/{problem_id}")
-        data = self._handle_response(response)
-        return Problem(**data)
+        # Problem statements are near-immutable once published.
+        response = self._cached_get(self._resource_url + str(problem_id), ttl=3600)
+        return self._handle_model_response(response, Problem)
 
     def submit_solution(
         self, problem_id: int, code: str, language: str, public: bool = False
@@ -68,7 +116,6 @@ class ProblemClient(BaseAPIClient[Union[Problem, List[ProblemBrief], Submission]
         """
         data = {"language": language, "code": code, "public": public}
         response = self.session.post(
-            f"{self.base_url}/problem/{problem_id}/submit", data=data
+            f"{self._resource_url}{problem_id}/submit", data=data
         )
-        data = self._handle_response(response)
-        return Submission(**data)
+        return self._handle_model_response(response, Submission)
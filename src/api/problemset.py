@@ -9,6 +9,8 @@ from .base import APIException, BaseAPIClient
 class ProblemsetClient(BaseAPIClient[Problemset]):
     """Client for problemset-related API endpoints."""
 
+    _resource_path = "problemset/"
+
     def get_problemset(self, problemset_id: int) -> Problemset:
         """
         Get details of a specific problemset.
@@ -19,9 +21,8 @@ class ProblemsetClient(BaseAPIClient[Problemset]):
         Returns:
             Problemset: Problemset details
         """
-        response = self.session.get(f"{self.base_url}/problemset/{problemset_id}")
-        data = self._handle_response(response)
-        return Problemset(**data)
+        response = self.session.get(self._resource_url + str(problemset_id))
+        return self._handle_model_response(response, Problemset)
 
     def join_problemset(self, problemset_id: int) -> None:
         """
@@ -33,7 +34,7 @@ class ProblemsetClient(BaseAPIClient[Problemset]):
         Raises:
             Exception: If join fails or user doesn't have permission
         """
-        response = self.session.post(f"{self.base_url}/problemset/{problemset_id}/join")
+        response = self.session.post(f"{self._resource_url}{problemset_id}/join")
         if response.status_code == 204:
             # Success with no content
             return
@@ -55,5 +56,5 @@ class ProblemsetClient(BaseAPIClient[Problemset]):
         Raises:
             Exception: If quit fails or user doesn't have permission
         """
-        response = self.session.post(f"{self.base_url}/problemset/{problemset_id}/quit")
+        response = self.session.post(f"{self._resource_url}{problemset_id}/quit")
         self._handle_response(response)
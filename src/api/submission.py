@@ -2,17 +2,33 @@
 Submission-specific API client.
 """
 
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 import requests
+from pydantic import TypeAdapter
 
-from ..models import Submission, SubmissionBrief
-from .base import BaseAPIClient
+from ..models import Submission, SubmissionBrief, SubmissionStatus
+from .base import BaseAPIClient, _adapter, _extract_cursor
+
+# Instantiated once so list validation reuses the compiled schema instead of
+# re-entering the per-item validator for every element.
+_SUBMISSION_BRIEF_LIST_ADAPTER = TypeAdapter(List[SubmissionBrief])
+
+# Submissions in these states are still being judged and must not be cached.
+_ACTIVE_STATUSES = frozenset(
+    {
+        SubmissionStatus.pending,
+        SubmissionStatus.compiling,
+        SubmissionStatus.judging,
+    }
+)
 
 
 class SubmissionClient(BaseAPIClient[Union[Submission, List[SubmissionBrief]]]):
     """Client for submission-related API endpoints."""
 
+    _resource_path = "submission/"
+
     def get_submission(self, submission_id: int) -> Submission:
         """
         Get status and details of a submission.
@@ -23,9 +39,52 @@ class SubmissionClient(BaseAPIClient[Union[Submission, List[SubmissionBrief]]]):
         Returns:
             Submission: Submission details including status, score, runtime, etc.
         """
-        response = self.session.get(f"{self.base_url}/submission/{submission_id}")
-        data = self._handle_response(response)
-        return Submission(**data)
+        url = self._resource_url + str(submission_id)
+
+        # Finished submissions never change, so cached entries have no expiry.
+        if self.cache is not None:
+            body = self.cache.get(url)
+            if body is not None:
+                return _adapter(Submission).validate_json(body)
+
+        response = self.session.get(url)
+        submission = self._handle_model_response(response, Submission)
+        if (
+            self.cache is not None
+            and submission.status is not None
+            and submission.status not in _ACTIVE_STATUSES
+            and isinstance(response.content, bytes)
+        ):
+            self.cache.set(url, response.content)
+        return submission
+
+    def get_submission_if_changed(
+        self, submission_id: int, etag: Optional[str] = None
+    ) -> tuple:
+        """
+        Get a submission only if it changed since the given ETag.
+
+        Designed for watch-style polling: passing the ETag from the
+        previous call lets the server answer 304 with no body when the
+        submission is unchanged.
+
+        Args:
+            submission_id: ID of the submission
+            etag: ETag returned by the previous call, if any
+
+        Returns:
+            tuple: (submission, etag) where submission is None when the
+                server reports it unchanged (HTTP 304)
+        """
+        url = self._resource_url + str(submission_id)
+        if etag:
+            response = self.session.get(url, headers={"If-None-Match": etag})
+            if response.status_code == 304:
+                return None, etag
+        else:
+            response = self.session.get(url)
+        submission = self._handle_model_response(response, Submission)
+        return submission, response.headers.get("ETag")
 
     def get_submissions(
         self,
@@ -48,21 +107,72 @@ class SubmissionClient(BaseAPIClient[Union[Submission, List[SubmissionBrief]]]):
         Returns:
             List[SubmissionBrief]: List of submission brief details.
         """
-        params = {
-            "username": username,
-            "problem_id": problem_id,
-            "status": status,
-            "lang": lang,
-            "cursor": cursor,
-        }
-        # Remove None values to avoid sending them as query parameters
-        params = {k: v for k, v in params.items() if v is not None}
-
-        response = self.session.get(f"{self.base_url}/submission/", params=params)
+        # Only send the filters that were actually given
+        params = {}
+        if username is not None:
+            params["username"] = username
+        if problem_id is not None:
+            params["problem_id"] = problem_id
+        if status is not None:
+            params["status"] = status
+        if lang is not None:
+            params["lang"] = lang
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        response = self.session.get(self._resource_url, params=params)
         data = self._handle_response(response)
-        return [
-            SubmissionBrief(**submission) for submission in data.get("submissions", [])
-        ]
+        return _SUBMISSION_BRIEF_LIST_ADAPTER.validate_python(
+            data.get("submissions", [])
+        )
+
+    def iter_submissions(
+        self,
+        username: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        status: Optional[str] = None,
+        lang: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Iterator[SubmissionBrief]:
+        """
+        Iterate over submissions across all pages.
+
+        Pages are fetched lazily, so consumers that stop early (e.g. after
+        the first N matches) never pay for the remaining pages.
+
+        Args:
+            username: Filter by username.
+            problem_id: Filter by problem ID.
+            status: Filter by submission status.
+            lang: Filter by programming language.
+            cursor: Optional pagination cursor to start from.
+
+        Yields:
+            SubmissionBrief: Submission briefs in listing order.
+        """
+        while True:
+            # Only send the filters that were actually given
+            params = {}
+            if username is not None:
+                params["username"] = username
+            if problem_id is not None:
+                params["problem_id"] = problem_id
+            if status is not None:
+                params["status"] = status
+            if lang is not None:
+                params["lang"] = lang
+            if cursor is not None:
+                params["cursor"] = cursor
+
+            response = self.session.get(self._resource_url, params=params)
+            data = self._handle_response(response)
+            yield from _SUBMISSION_BRIEF_LIST_ADAPTER.validate_python(
+                data.get("submissions", [])
+            )
+
+            cursor = _extract_cursor(data.get("next"))
+            if not cursor:
+                return
 
     def abort_submission(self, submission_id: int) -> None:
         """
@@ -71,7 +181,5 @@ class SubmissionClient(BaseAPIClient[Union[Submission, List[SubmissionBrief]]]):
         Args:
             submission_id: ID of the submission to abort
         """
-        response = self.session.post(
-            f"{self.base_url}/submission/{submission_id}/abort"
-        )
+        response = self.session.post(f"{self._resource_url}{submission_id}/abort")
         self._handle_response(response)
@@ -4,13 +4,22 @@ User-specific API client.
 
 from typing import List, Union
 
+from pydantic import TypeAdapter
+
 from ..models import Course, Problemset, Profile
 from .base import BaseAPIClient
 
+# Instantiated once so list validation reuses the compiled schema instead of
+# re-entering the per-item validator for every element.
+_COURSE_LIST_ADAPTER = TypeAdapter(List[Course])
+_PROBLEMSET_LIST_ADAPTER = TypeAdapter(List[Problemset])
+
 
 class UserClient(BaseAPIClient[Union[Profile, List[Course], List[Problemset]]]):
     """Client for user-related API endpoints."""
 
+    _resource_path = "user/"
+
     def get_profile(self) -> Profile:
         """
         Get current user's profile.
@@ -18,10 +27,8 @@ class UserClient(BaseAPIClient[Union[Profile, List[Course], List[Problemset]]]):
         Returns:
             Profile: User profile information
         """
-        response = self.session.get(f"{self.base_url}/user/profile")
-        # return self._handle_response(response)
-        data = self._handle_response(response)
-        return Profile(**data)
+        response = self.session.get(self._resource_url + "profile")
+        return self._handle_model_response(response, Profile)
 
     def get_user_courses(self) -> List[Course]:
         """
@@ -30,9 +37,9 @@ class UserClient(BaseAPIClient[Union[Profile, List[Course], List[Problemset]]]):
         Returns:
             List[Course]: List of enrolled course details
         """
-        response = self.session.get(f"{self.base_url}/user/courses")
+        response = self.session.get(self._resource_url + "courses")
         data = self._handle_response(response)
-        return [Course(**course) for course in data.get("courses", [])]
+        return _COURSE_LIST_ADAPTER.validate_python(data.get("courses", []))
 
     def get_user_problemsets(self) -> List[Problemset]:
         """
@@ -41,9 +48,9 @@ class UserClient(BaseAPIClient[Union[Profile, List[Course], List[Problemset]]]):
         Returns:
             List[Problemset]: List of enrolled problemset details
         """
-        response = self.session.get(f"{self.base_url}/user/problemsets")
+        response = self.session.get(self._resource_url + "problemsets")
         data = self._handle_response(response)
-        return [Problemset(**problemset) for problemset in data.get("problemsets", [])]
+        return _PROBLEMSET_LIST_ADAPTER.validate_python(data.get("problemsets", []))
 
     def get_oauth_token(self, data: dict) -> dict:
         """
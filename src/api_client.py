@@ -2,48 +2,113 @@
 Main API client that composes specialized clients for different resource types.
 """
 
+from __future__ import annotations
+
+import functools
 import logging
-from typing import Dict, List, Literal, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Literal, Optional, Tuple
 
 import requests
 
-from .api.course import CourseClient
-from .api.problem import ProblemClient
-from .api.problemset import ProblemsetClient
-from .api.submission import SubmissionClient
-from .api.user import UserClient
+from . import __version__
 from .config import Config
-from .models import (
-    Course,
-    Problem,
-    ProblemBrief,
-    Problemset,
-    Profile,
-    Submission,
-    SubmissionBrief,
-)
+
+if TYPE_CHECKING:
+    from .api.course import CourseClient
+    from .api.problem import ProblemClient
+    from .api.problemset import ProblemsetClient
+    from .api.submission import SubmissionClient
+    from .api.user import UserClient
+    from .models import (
+        Course,
+        Problem,
+        ProblemBrief,
+        Problemset,
+        Profile,
+        Submission,
+        SubmissionBrief,
+    )
 
 
 class APIClient:
     """Client for making requests to the ACM-OJ API."""
 
-    def __init__(self):
-        """Initialize API client with specialized clients for each resource type."""
+    def __init__(self, use_cache: bool = False):
+        """
+        Initialize API client with specialized clients for each resource type.
+
+        Args:
+            use_cache: Enable the local response cache for GET endpoints
+        """
+        # Sub-client modules (and the pydantic models they pull in) are
+        # imported lazily; a command that only needs one client never pays
+        # the import cost of the other four.
+        from .api.base import _accept_encoding, _build_adapter
+
         self.logger = logging.getLogger(__name__)
         self.session = requests.Session()
         self.config = Config()
+        self.cache = None
+        if use_cache:
+            from .api.cache import ResponseCache
+
+            self.cache = ResponseCache(self.config.config_dir / "cache.db")
+
+        # Mount the pooled adapter once on the shared session so all
+        # sub-clients use a single connection pool.
+        self.session.mount("https://", _build_adapter())
+        self.session.headers.update(
+            {
+                "Connection": "keep-alive",
+                "User-Agent": f"termoj/{__version__}",
+                "Accept-Encoding": _accept_encoding(),
+            }
+        )
 
         self.logger.info("Initializing API client")
-        # Initialize specialized clients
-        self.user = UserClient(session=self.session, config=self.config)
-        self.problem = ProblemClient(session=self.session, config=self.config)
-        self.submission = SubmissionClient(session=self.session, config=self.config)
-        self.course = CourseClient(session=self.session, config=self.config)
-        self.problemset = ProblemsetClient(session=self.session, config=self.config)
-
         self._load_token()
         self.logger.info("API client initialization complete")
 
+    @functools.cached_property
+    def user(self) -> UserClient:
+        """User sub-client, constructed on first use."""
+        from .api.user import UserClient
+
+        return UserClient(session=self.session, config=self.config, cache=self.cache)
+
+    @functools.cached_property
+    def problem(self) -> ProblemClient:
+        """Problem sub-client, constructed on first use."""
+        from .api.problem import ProblemClient
+
+        return ProblemClient(session=self.session, config=self.config, cache=self.cache)
+
+    @functools.cached_property
+    def submission(self) -> SubmissionClient:
+        """Submission sub-client, constructed on first use."""
+        from .api.submission import SubmissionClient
+
+        return SubmissionClient(
+            session=self.session, config=self.config, cache=self.cache
+        )
+
+    @functools.cached_property
+    def course(self) -> CourseClient:
+        """Course sub-client, constructed on first use."""
+        from .api.course import CourseClient
+
+        return CourseClient(session=self.session, config=self.config, cache=self.cache)
+
+    @functools.cached_property
+    def problemset(self) -> ProblemsetClient:
+        """Problemset sub-client, constructed on first use."""
+        from .api.problemset import ProblemsetClient
+
+        return ProblemsetClient(
+            session=self.session, config=self.config, cache=self.cache
+        )
+
     def _load_token(self):
         """Load authentication token from config."""
         self.token = self.config.token
@@ -60,20 +125,19 @@ class APIClient:
         Args:
             token: Personal access token from ACM-OJ
         """
+        if token == self.token and "Authorization" in self.session.headers:
+            # Same token already active; nothing to re-format or persist
+            return
         self.logger.info("Setting new authentication token")
         self.token = token
         self.config.token = token
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
-
-        # Update token for all clients
-        for client in [
-            self.user,
-            self.problem,
-            self.submission,
-            self.course,
-            self.problemset,
-        ]:
-            client.set_token(token)
+        # Sub-clients authenticate through the shared session, so a single
+        # header write covers all of them
+        self.session.headers["Authorization"] = f"Bearer {token}"
+        # Cached bodies were fetched under the previous identity; drop them
+        # so another account's permissions never leak through the cache.
+        if self.cache is not None:
+            self.cache.clear()
         self.logger.info("Authentication token updated for all clients")
 
     def clear_token(self):
@@ -93,19 +157,37 @@ class APIClient:
         if "Authorization" in self.session.headers:
             del self.session.headers["Authorization"]
 
-        # 更新所有子客户端的 Token
-        for client in [
-            self.user,
-            self.problem,
-            self.submission,
-            self.course,
-            self.problemset,
-        ]:
-            if hasattr(client, "set_token"):
-                client.set_token(None)
+        # Responses cached for this account must not survive the logout
+        if self.cache is not None:
+            self.cache.clear()
 
         self.logger.info("Authentication token cleared for all clients")
 
+    def gather(self, *calls) -> List:
+        """
+        Run independent API calls concurrently and return results in order.
+
+        All calls share the pooled session, so N network-bound requests
+        complete in roughly one round trip instead of N.
+
+        Args:
+            calls: Callables, or (callable, args) / (callable, args, kwargs)
+                tuples, to execute
+
+        Returns:
+            List: Result of each call, in the order the calls were given
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = []
+            for call in calls:
+                if callable(call):
+                    call = (call,)
+                func = call[0]
+                args = call[1] if len(call) > 1 else ()
+                kwargs = call[2] if len(call) > 2 else {}
+                futures.append(executor.submit(func, *args, **kwargs))
+            return [future.result() for future in futures]
+
     # User endpoints delegated to UserClient
     def get_profile(self) -> Profile:
         """Get current user's profile."""
@@ -126,6 +208,22 @@ class APIClient:
         """Get list of problemsets the current user is enrolled in."""
         return self.user.get_user_problemsets()
 
+    def get_user_dashboard(self) -> Tuple[List[Course], List[Problemset]]:
+        """
+        Get the user's courses and problemsets in one concurrent batch.
+
+        The two independent requests run through gather(), so the total
+        latency is the slower of the two instead of their sum.
+
+        Returns:
+            Tuple[List[Course], List[Problemset]]: Enrolled courses and
+                problemsets
+        """
+        courses, problemsets = self.gather(
+            self.get_user_courses, self.get_user_problemsets
+        )
+        return courses, problemsets
+
     # Problem endpoints delegated to ProblemClient
     def get_problems(
         self,
@@ -136,6 +234,15 @@ class APIClient:
         """Fetch available problems from the platform."""
         return self.problem.get_problems(keyword, problemset_id, cursor)
 
+    def iter_problems(
+        self,
+        keyword: Optional[str] = None,
+        problemset_id: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> Iterator[ProblemBrief]:
+        """Iterate over problems across all pages, fetching lazily."""
+        return self.problem.iter_problems(keyword, problemset_id, cursor)
+
     def get_problem(self, problem_id: int) -> Problem:
         """Get detailed information about a specific problem."""
         return self.problem.get_problem(problem_id)
@@ -162,6 +269,12 @@ class APIClient:
         """Get status and details of a submission."""
         return self.submission.get_submission(submission_id)
 
+    def get_submission_if_changed(
+        self, submission_id: int, etag: Optional[str] = None
+    ) -> Tuple[Optional[Submission], Optional[str]]:
+        """Get a submission only if it changed since the given ETag."""
+        return self.submission.get_submission_if_changed(submission_id, etag)
+
     def get_submissions(
         self,
         username: Optional[str] = None,
@@ -178,6 +291,19 @@ class APIClient:
             username, problem_id, status, lang, cursor
         )
 
+    def iter_submissions(
+        self,
+        username: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        status: Optional[str] = None,
+        lang: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Iterator[SubmissionBrief]:
+        """Iterate over submissions across all pages, fetching lazily."""
+        return self.submission.iter_submissions(
+            username, problem_id, status, lang, cursor
+        )
+
     def abort_submission(self, submission_id: int) -> None:
         """Abort a running submission."""
         return self.submission.abort_submission(submission_id)
@@ -31,8 +31,13 @@ class CustomGroup(click.Group):
     "--version",
     message="%(prog)s, version %(version)s",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the local response cache and always hit the API.",
+)
 @click.pass_context
-def cli(ctx: click.Context):
+def cli(ctx: click.Context, no_cache: bool):
     """ACM Online Judge CLI tool.
 
     A command-line interface for interacting with the ACM-OJ platform.
@@ -72,7 +77,7 @@ def cli(ctx: click.Context):
     """
     ctx.obj = Context()
     # Initialize API client
-    ctx.obj.api_client = APIClient()
+    ctx.obj.api_client = APIClient(use_cache=not no_cache)
 
 
 # Register command groups
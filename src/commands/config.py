@@ -6,6 +6,25 @@ import click
 
 from ..context import Context
 
+# Valid display modes, frozen once for O(1) membership checks.
+_VALID_MODES = frozenset({"plain", "rich", "cartoon"})
+
+# Option dispatch tables: adding a setting means adding one entry here
+# instead of growing if/elif chains in both commands.
+# name -> (validator, apply, human-readable valid values)
+_OPTION_SETTERS = {
+    "display_mode": (
+        lambda value: value in _VALID_MODES,
+        lambda ctx, value: ctx.update_display_mode(value),
+        "plain, rich, cartoon",
+    ),
+}
+
+# name -> getter
+_OPTION_GETTERS = {
+    "display_mode": lambda ctx: ctx.config.display_mode,
+}
+
 
 @click.group()
 def config():
@@ -40,15 +59,17 @@ def set(ctx: Context, option: str, value: str):
     - display_mode: plain, rich, or cartoon
     """
     try:
-        if option == "display_mode":
-            if value not in ["plain", "rich", "cartoon"]:
-                raise ValueError(
-                    f"Invalid display mode: {value}. Must be one of: plain, rich, cartoon"
-                )
-            ctx.update_display_mode(value)
-            ctx.display_message(f"Option {option} set to: {value}")
-        else:
+        entry = _OPTION_SETTERS.get(option)
+        if entry is None:
             ctx.display_message(f"Unknown option: {option}")
+            return
+        validator, apply, valid_values = entry
+        if not validator(value):
+            raise ValueError(
+                f"Invalid {option}: {value}. Must be one of: {valid_values}"
+            )
+        apply(ctx, value)
+        ctx.display_message(f"Option {option} set to: {value}")
     except Exception as e:
         ctx.display_message(f"Error: {str(e)}")
 
@@ -65,10 +86,11 @@ def get(ctx: Context, option: str):
     - display_mode: Current display mode setting
     """
     try:
-        if option == "display_mode":
-            ctx.display_message(f"display_mode = {ctx.config.display_mode}")
-        else:
+        getter = _OPTION_GETTERS.get(option)
+        if getter is None:
             ctx.display_message(f"Unknown option: {option}")
+            return
+        ctx.display_message(f"{option} = {getter(ctx)}")
     except Exception as e:
         ctx.display_message(f"Error: {str(e)}")
 
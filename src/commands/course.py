@@ -2,12 +2,61 @@
 Course-related commands for the ACM-OJ CLI.
 """
 
+import functools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import click
 
 from ..context import Context
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_page(api_client, keyword, term, tag, cursor):
+    """
+    Fetch one page of courses, memoized per filter/cursor combination.
+
+    Within a single invocation the same page (e.g. revisited after a
+    failed prefetch) is served from memory instead of re-hitting the API.
+    """
+    return api_client.get_courses(keyword=keyword, term=term, tag=tag, cursor=cursor)
+
+
+# Fixed-format strftime is cheaper than datetime.__str__, which checks
+# microseconds and timezone on every call.
+_DT_FMT = "%Y-%m-%d %H:%M"
+
+
+def _format_dt(dt) -> str:
+    """Format an optional datetime for table display."""
+    return dt.strftime(_DT_FMT) if dt else "—"
+
+
+def _format_term(term) -> str:
+    """Format a course term with its start and end dates for display."""
+    if not term:
+        return "No term information"
+    return f"{term.name} ({_format_dt(term.start_time)} - {_format_dt(term.end_time)})"
+
+
+_COURSE_HEADERS = ["ID", "Name", "Term", "Tag", "Description"]
+
+
+def _course_rows(courses):
+    """Yield display rows for a list of courses."""
+    for course in courses:
+        yield [
+            course.id,
+            course.name,
+            course.term.name if course.term else "—",
+            course.tag.name if course.tag else "—",
+            course.description or "—",
+        ]
+
 
 @click.group()
 def course():
@@ -20,6 +69,12 @@ def course():
 @click.option("--term", type=int, help="Filter courses by term ID")
 @click.option("--tag", type=int, help="Filter courses by tag ID")
 @click.option("--cursor", type=int, help="Pagination cursor")
+@click.option(
+    "--all",
+    "fetch_all",
+    is_flag=True,
+    help="Fetch every page without prompting (for scripting).",
+)
 @click.pass_obj
 def list(
     ctx: Context,
@@ -27,52 +82,95 @@ def list(
     term: Optional[int],
     tag: Optional[int],
     cursor: Optional[int],
+    fetch_all: bool,
 ):
     """List available courses."""
-    page_number = 1  # Track the current page
-    while True:
-        ctx.display_message(f"Courses - Page {page_number}")
-
+    if fetch_all:
+        # Non-interactive bulk mode: drain all pages and emit one table,
+        # with no per-page prompt stalling scripted use.
         try:
-            courses, next_cursor = ctx.api_client.get_courses(
-                keyword=keyword, term=term, tag=tag, cursor=cursor
-            )
-            if not courses:
-                ctx.display_message("No more courses found.")
+            all_rows = []
+            while True:
+                courses, next_cursor = _fetch_page(
+                    ctx.api_client, keyword, term, tag, cursor
+                )
+                all_rows.extend(_course_rows(courses))
+                if not next_cursor:
+                    break
+                cursor = next_cursor
+            if not all_rows:
+                ctx.display_message("No courses found.")
                 return
+            ctx.display_table(_COURSE_HEADERS, all_rows)
+        except Exception as e:
+            ctx.display_message(f"Failed to fetch courses: {str(e)}")
+        return
 
-            headers = ["ID", "Name", "Term", "Tag", "Description"]
-            rows = [
-                [
-                    course.id,
-                    course.name,
-                    course.term.name if course.term else "—",
-                    course.tag.name if course.tag else "—",
-                    course.description or "—",
-                ]
-                for course in courses
-            ]
-            ctx.display_table(headers, rows)
+    page_number = 1  # Track the current page
+    prefetch = None
+    # Page banners are decoration; skip them when output is piped so
+    # redirected runs contain only the tables
+    is_tty = sys.stdout.isatty()
+    # One worker is enough: at most one page is fetched ahead while the
+    # user reads the current one.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            if is_tty:
+                ctx.display_message(f"Courses - Page {page_number}")
 
-            if not next_cursor:
-                ctx.display_message("End of results. No more pages available.")
-                break
+            try:
+                if prefetch is not None:
+                    try:
+                        courses, next_cursor = prefetch.result()
+                    except Exception:
+                        # Prefetch failed; fall back to a synchronous fetch,
+                        # but leave a trace so a systematic failure (which
+                        # would silently disable prefetching) is visible.
+                        logger.warning(
+                            "Course page prefetch failed; fetching synchronously",
+                            exc_info=True,
+                        )
+                        courses, next_cursor = _fetch_page(
+                            ctx.api_client, keyword, term, tag, cursor
+                        )
+                    prefetch = None
+                else:
+                    courses, next_cursor = _fetch_page(
+                        ctx.api_client, keyword, term, tag, cursor
+                    )
+                if not courses:
+                    ctx.display_message("No more courses found.")
+                    return
 
-            proceed = click.prompt(
-                "Press [Enter] to load the next page or type 'q' to quit",
-                default="",
-                show_default=False,
-            )
-            if proceed.lower() == "q":
-                ctx.display_message("Exiting course list. Goodbye!")
-                break
+                # Generator rows: each row is built only as the renderer
+                # consumes it, so no second copy of the page is held
+                ctx.display_table(_COURSE_HEADERS, _course_rows(courses))
 
-            cursor = next_cursor
-            page_number += 1
+                if not next_cursor:
+                    ctx.display_message("End of results. No more pages available.")
+                    break
 
-        except Exception as e:
-            ctx.display_message(f"Failed to fetch courses: {str(e)}")
-            break
+                # Overlap the next page's fetch with the user's read time so
+                # pressing Enter renders instantly
+                prefetch = executor.submit(
+                    _fetch_page, ctx.api_client, keyword, term, tag, next_cursor
+                )
+
+                proceed = click.prompt(
+                    "Press [Enter] to load the next page or type 'q' to quit",
+                    default="",
+                    show_default=False,
+                )
+                if proceed.lower() == "q":
+                    ctx.display_message("Exiting course list. Goodbye!")
+                    break
+
+                cursor = next_cursor
+                page_number += 1
+
+            except Exception as e:
+                ctx.display_message(f"Failed to fetch courses: {str(e)}")
+                break
 
 
 @course.command()
@@ -85,18 +183,7 @@ def enrolled(ctx: Context):
             ctx.display_message("You are not enrolled in any courses.")
             return
 
-        headers = ["ID", "Name", "Term", "Tag", "Description"]
-        rows = [
-            [
-                course.id,
-                course.name,
-                course.term.name if course.term else "—",
-                course.tag.name if course.tag else "—",
-                course.description or "—",
-            ]
-            for course in courses
-        ]
-        ctx.display_table(headers, rows)
+        ctx.display_table(_COURSE_HEADERS, _course_rows(courses))
 
     except Exception as e:
         ctx.display_message(f"Failed to fetch enrolled courses: {str(e)}")
@@ -114,14 +201,7 @@ def show(ctx: Context, course_id: int):
         headers = ["Field", "Value"]
         rows = [
             ["Description", course.description or "No description provided"],
-            [
-                "Term",
-                (
-                    f"{course.term.name} ({course.term.start_time} - {course.term.end_time})"
-                    if course.term
-                    else "No term information"
-                ),
-            ],
+            ["Term", _format_term(course.term)],
             ["Tag", course.tag.name if course.tag else "No tag available"],
         ]
         ctx.display_table(headers, rows)
@@ -185,22 +265,18 @@ def problemsets(ctx: Context, course_id: int):
             "Late Deadline",
             "Description",
         ]
-        rows = [
+        rows = (
             [
                 ps.id,
                 ps.name,
                 ps.type.value,
-                str(ps.start_time),
-                str(ps.end_time),
-                (
-                    str(ps.late_submission_deadline)
-                    if ps.late_submission_deadline
-                    else "—"
-                ),
+                _format_dt(ps.start_time),
+                _format_dt(ps.end_time),
+                _format_dt(ps.late_submission_deadline),
                 ps.description or "—",
             ]
             for ps in problemsets
-        ]
+        )
         ctx.display_table(headers, rows)
 
     except Exception as e:
@@ -2,47 +2,135 @@
 Problem-specific commands.
 """
 
+from __future__ import annotations
+
+import functools
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from pylatexenc.latex2text import LatexNodes2Text
-from rich.box import ROUNDED, SIMPLE
-from rich.columns import Columns
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.rule import Rule
-from rich.syntax import Syntax
-from rich.table import Table
 
 from ..context import Context
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.syntax import Syntax
+
+
+# Languages the judge accepts, frozen once for the submit option.
+_LANGS = ("cpp", "python", "java", "git", "verilog")
+
+# Refuse to read source files larger than this; the judge rejects them
+# anyway, and the check avoids slurping a mistakenly passed binary.
+MAX_SUBMIT_BYTES = 1 << 20
+
+# Both math delimiters in one alternation; the $$...$$ branch comes
+# first so a display block is never half-matched as two inline spans.
+# DOTALL lets display blocks span lines; inline spans stay single-line.
+_MATH_RE = re.compile(r"\$\$(?P<disp>.*?)\$\$|\$(?P<inl>[^\n]*?)\$", re.DOTALL)
+
 
+@functools.lru_cache(maxsize=1)
+def _get_latex_converter():
+    """Return the shared LaTeX-to-text converter, built on first use.
 
+    LatexNodes2Text builds its macro tables at construction; one instance
+    serves every math span instead of rebuilding them per match.
+    """
+    from pylatexenc.latex2text import LatexNodes2Text
+
+    return LatexNodes2Text()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared console, importing rich on first use.
+
+    rich and pylatexenc together account for a large share of this
+    module's import time, so commands that never render (e.g. --help)
+    should not pay for them.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=2048)
+def _latex_to_text(latex: str) -> str:
+    """Convert a single math span to text, memoizing repeated spans.
+
+    Problem statements repeat the same short spans (variable names,
+    bounds like $10^9$) many times; parsing each distinct span once is
+    enough.
+    """
+    return _get_latex_converter().latex_to_text(latex)
+
+
+@functools.lru_cache(maxsize=64)
 def process_latex(text: str) -> str:
     """Process LaTeX math expressions in text.
 
     Converts both inline ($...$) and display ($$...$$) math to ASCII.
+    Results are memoized, so re-rendering the same problem section is
+    free.
     """
+    # Most statements contain no math at all; a plain substring scan is
+    # far cheaper than running the regex to find zero matches.
+    if "$" not in text:
+        return text
 
     def replace_math(match):
-        latex = match.group(1)
-        return LatexNodes2Text().latex_to_text(latex)
+        disp = match.group("disp")
+        if disp is not None:
+            return "\n" + _latex_to_text(disp) + "\n"
+        return _latex_to_text(match.group("inl"))
 
-    # Replace display math first ($$...$$)
-    text = re.sub(r"\$\$(.*?)\$\$", lambda m: "\n" + replace_math(m) + "\n", text)
-    # Then replace inline math ($...$)
-    text = re.sub(r"\$(.*?)\$", replace_math, text)
-    return text
+    # One pass handles both display and inline math
+    return _MATH_RE.sub(replace_math, text)
 
 
 def format_code_block(code: str, language: str = "") -> Syntax:
     """Format code blocks with syntax highlighting."""
+    from rich.syntax import Syntax
+
     return Syntax(code, language, theme="monokai", line_numbers=True)
 
 
+# Characters that signal markdown structure (emphasis, code, links,
+# headings, quotes, tables, list markers). Plain prose has none of them.
+_MD_TOKENS_RE = re.compile(r"[#*`\[_>|~-]")
+
+
+def _render_prose(text: str):
+    """Return a renderable for a prose field.
+
+    Runs the commonmark parser only when the text actually contains
+    markdown syntax or paragraph breaks; plain sentences render as
+    rich Text directly.
+    """
+    from rich.markdown import Markdown
+    from rich.text import Text
+
+    if _MD_TOKENS_RE.search(text) or "\n\n" in text:
+        return Markdown(text)
+    return Text(text)
+
+
+def _side_by_side(left, right):
+    """Lay two renderables out in equal halves of the terminal width.
+
+    A two-column Table.grid renders the pair in one measuring pass,
+    unlike Columns which iterates to fit its children.
+    """
+    from rich.table import Table
+
+    grid = Table.grid(padding=(0, 2), expand=True)
+    grid.add_column(ratio=1)
+    grid.add_column(ratio=1)
+    grid.add_row(left, right)
+    return grid
+
+
 @click.group()
 def problem():
     """Manage and interact with problems."""
@@ -54,26 +142,35 @@ def problem():
 @click.pass_obj
 def show(ctx: Context, problem_id: int):
     """Show details of a specific problem."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.rule import Rule
+
+    console = _get_console()
     try:
         problem = ctx.api_client.get_problem(problem_id)
 
+        # Collect every section and print once at the end: one layout
+        # computation and one flush instead of one per section.
+        sections = []
+
         # --- HEADER ---
-        console.print(
+        sections.append(
             Panel(
                 f"[bold blue]Problem {problem.id}: {problem.title}[/bold blue]",
                 border_style="blue",
                 expand=True,
             )
         )
-        console.print(Rule(style="blue"))
+        sections.append(Rule(style="blue"))
 
         # --- DESCRIPTION ---
         description_text = process_latex(
             problem.description or "No description provided."
         )
-        console.print(
+        sections.append(
             Panel(
-                Markdown(description_text),
+                _render_prose(description_text),
                 title="[bold cyan]Description[/bold cyan]",
                 border_style="cyan",
                 expand=False,
@@ -85,26 +182,22 @@ def show(ctx: Context, problem_id: int):
         input_text = process_latex(problem.input or "No input format provided.")
         output_text = process_latex(problem.output or "No output format provided.")
 
-        console.print(
-            Columns(
-                [
-                    Panel(
-                        Markdown(input_text),
-                        title="[bold green]Input Format[/bold green]",
-                        border_style="green",
-                        padding=(1, 2),
-                        expand=True,
-                    ),
-                    Panel(
-                        Markdown(output_text),
-                        title="[bold yellow]Output Format[/bold yellow]",
-                        border_style="yellow",
-                        padding=(1, 2),
-                        expand=True,
-                    ),
-                ],
-                equal=True,
-                expand=True,
+        sections.append(
+            _side_by_side(
+                Panel(
+                    _render_prose(input_text),
+                    title="[bold green]Input Format[/bold green]",
+                    border_style="green",
+                    padding=(1, 2),
+                    expand=True,
+                ),
+                Panel(
+                    _render_prose(output_text),
+                    title="[bold yellow]Output Format[/bold yellow]",
+                    border_style="yellow",
+                    padding=(1, 2),
+                    expand=True,
+                ),
             )
         )
 
@@ -118,32 +211,28 @@ def show(ctx: Context, problem_id: int):
             else "No languages specified."
         )
 
-        console.print(
-            Columns(
-                [
-                    Panel(
-                        Markdown(constraints_text),
-                        title="[bold magenta]Constraints[/bold magenta]",
-                        border_style="magenta",
-                        padding=(1, 2),
-                        expand=True,
-                    ),
-                    Panel(
-                        f"[green]{languages_text}[/green]",
-                        title="[bold blue]Accepted Languages[/bold blue]",
-                        border_style="blue",
-                        padding=(1, 2),
-                        expand=True,
-                    ),
-                ],
-                equal=True,
-                expand=True,
+        sections.append(
+            _side_by_side(
+                Panel(
+                    _render_prose(constraints_text),
+                    title="[bold magenta]Constraints[/bold magenta]",
+                    border_style="magenta",
+                    padding=(1, 2),
+                    expand=True,
+                ),
+                Panel(
+                    f"[green]{languages_text}[/green]",
+                    title="[bold blue]Accepted Languages[/bold blue]",
+                    border_style="blue",
+                    padding=(1, 2),
+                    expand=True,
+                ),
             )
         )
 
         # --- EXAMPLES (Side by Side per Test Case) ---
-        console.print(Rule(style="cyan"))
-        console.print("[bold cyan]Examples[/bold cyan]")
+        sections.append(Rule(style="cyan"))
+        sections.append("[bold cyan]Examples[/bold cyan]")
 
         if problem.examples:
             for i, example in enumerate(problem.examples, start=1):
@@ -151,41 +240,39 @@ def show(ctx: Context, problem_id: int):
                 output_example = example.output or "No Output Provided"
                 explanation = example.description or ""
 
-                console.print(
-                    Columns(
-                        [
-                            Panel(
-                                format_code_block(input_example),
-                                title=f"[bold cyan]Example {i} - Input[/bold cyan]",
-                                border_style="cyan",
-                                padding=(1, 2),
-                                expand=True,
-                            ),
-                            Panel(
-                                format_code_block(output_example),
-                                title=f"[bold cyan]Example {i} - Output[/bold cyan]",
-                                border_style="cyan",
-                                padding=(1, 2),
-                                expand=True,
-                            ),
-                        ],
-                        equal=True,
-                        expand=True,
+                sections.append(
+                    _side_by_side(
+                        Panel(
+                            format_code_block(input_example),
+                            title=f"[bold cyan]Example {i} - Input[/bold cyan]",
+                            border_style="cyan",
+                            padding=(1, 2),
+                            expand=True,
+                        ),
+                        Panel(
+                            format_code_block(output_example),
+                            title=f"[bold cyan]Example {i} - Output[/bold cyan]",
+                            border_style="cyan",
+                            padding=(1, 2),
+                            expand=True,
+                        ),
                     )
                 )
 
                 if explanation:
-                    console.print(
+                    sections.append(
                         Panel(
-                            Markdown(process_latex(explanation)),
+                            _render_prose(process_latex(explanation)),
                             title="[bold cyan]Explanation[/bold cyan]",
                             border_style="cyan",
                             padding=(1, 2),
                         )
                     )
-                console.print(Rule(style="cyan"))
+                sections.append(Rule(style="cyan"))
         else:
-            console.print("[italic]No examples provided.[/italic]")
+            sections.append("[italic]No examples provided.[/italic]")
+
+        console.print(Group(*sections))
 
     except Exception as e:
         console.print(f"[red]Failed to fetch problem details: {str(e)}[/red]")
@@ -198,16 +285,25 @@ def show(ctx: Context, problem_id: int):
     "--language",
     "-l",
     required=True,
-    type=click.Choice(
-        ["cpp", "python", "java", "git", "verilog"], case_sensitive=False
-    ),
+    type=click.Choice(_LANGS, case_sensitive=False),
 )
 @click.pass_obj
 def submit(ctx: Context, problem_id: int, file: str, language: str):
     """Submit a solution to a problem."""
+    import os
+
+    size = os.path.getsize(file)
+    if size > MAX_SUBMIT_BYTES:
+        raise click.ClickException(
+            f"{file} is {size} bytes; submissions are limited to "
+            f"{MAX_SUBMIT_BYTES} bytes."
+        )
+
     try:
-        with open(file, "r") as f:
-            code = f.read()
+        # Binary read + one decode skips TextIOWrapper's incremental
+        # decoder and newline translation
+        with open(file, "rb") as f:
+            code = f.read().decode("utf-8")
 
         result = ctx.api_client.submit_solution(problem_id, code, language.lower())
         submission_id = result.id
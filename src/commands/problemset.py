@@ -8,6 +8,9 @@ import click
 
 from ..context import Context
 
+# Column headers, built once at import like the course listing's.
+_PROBLEMSET_HEADERS = ["ID", "Name", "Type", "Start Time", "End Time"]
+
 
 @click.group()
 def problemset():
@@ -25,12 +28,11 @@ def list(ctx: Context):
             ctx.display_message("No problemsets found.")
             return
 
-        # Sort problemsets by ID in ascending order
-        problemsets = sorted(
-            problemsets, key=lambda ps: ps.id if ps.id is not None else float("inf")
-        )
+        # Sort problemsets by ID in ascending order, in place to avoid a
+        # second list; the tuple key keeps missing IDs last without
+        # boxing a float("inf") sentinel per element
+        problemsets.sort(key=lambda ps: (ps.id is None, ps.id))
 
-        headers = ["ID", "Name", "Type", "Start Time", "End Time"]
         rows = [
             [
                 ps.id,
@@ -42,7 +44,7 @@ def list(ctx: Context):
             for ps in problemsets
         ]
 
-        ctx.display_table(headers, rows)
+        ctx.display_table(_PROBLEMSET_HEADERS, rows)
 
     except Exception as e:
         ctx.display_message(f"Failed to fetch problemsets: {str(e)}")
@@ -2,13 +2,81 @@
 Submission-related commands.
 """
 
+import sys
 import time
 from typing import List, Optional
 
 import click
 
 from ..context import Context
-from ..models import Profile, Submission, SubmissionBrief
+from ..models import Submission, SubmissionBrief
+
+# Column headers, built once at import like the course listing's.
+_SUBMISSION_HEADERS = [
+    "ID",
+    "Problem ID",
+    "Problem Title",
+    "Language",
+    "Status",
+    "Created At",
+]
+
+# Terminal judge states; polling stops once one of these is reached.
+_COMPLETED_STATUSES = frozenset(
+    {
+        "accepted",
+        "wrong_answer",
+        "compile_error",
+        "runtime_error",
+        "time_limit_exceeded",
+        "memory_limit_exceeded",
+        "system_error",
+    }
+)
+
+
+# Reciprocal so memory formatting multiplies instead of divides.
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+
+def _format_memory(memory_bytes: int) -> str:
+    """Format a byte count as megabytes for table display."""
+    return f"{memory_bytes * _BYTES_TO_MB:.2f} MB"
+
+
+def _submission_row(sub: SubmissionBrief) -> List[str]:
+    """Build one display row for a submission brief."""
+    # Bind each attribute once; pydantic model attribute access and enum
+    # .value both go through descriptors, so repeated reads add up on
+    # large pages
+    problem = sub.problem
+    language = sub.language
+    status = sub.status
+    created_at = sub.created_at
+    return [
+        sub.id,
+        str(problem.id) if problem and problem.id else "N/A",
+        problem.title if problem and problem.title else "N/A",
+        language.value if language else "N/A",
+        status.value if status else "N/A",
+        created_at.strftime("%Y-%m-%d %H:%M:%S") if created_at else "N/A",
+    ]
+
+
+def _flatten_test(index: int, test: dict) -> List[List[str]]:
+    """Build the display rows for one test-case entry."""
+    get = test.get  # hoist the bound method for the repeated lookups
+    rows = [[f"Test {index} Status", get("status", "Unknown")]]
+    time_msecs = get("time_msecs")
+    if time_msecs is not None:
+        rows.append([f"Test {index} Time", f"{time_msecs} ms"])
+    memory_bytes = get("memory_bytes")
+    if memory_bytes is not None:
+        rows.append([f"Test {index} Memory", _format_memory(memory_bytes)])
+    message = get("message")
+    if message is not None:
+        rows.append([f"Test {index} Message", message])
+    return rows
 
 
 @click.group()
@@ -52,8 +120,7 @@ def status(ctx: Context, submission_id: int, watch: bool, interval: int):
             rows.append(["Time", f"{submission.time_msecs} ms"])
 
         if submission.memory_bytes is not None:
-            memory_mb = submission.memory_bytes / (1024 * 1024)
-            rows.append(["Memory", f"{memory_mb:.2f} MB"])
+            rows.append(["Memory", _format_memory(submission.memory_bytes)])
 
         if submission.message:
             rows.append(["Message", submission.message])
@@ -61,14 +128,7 @@ def status(ctx: Context, submission_id: int, watch: bool, interval: int):
         if submission.details:
             test_cases = submission.details.get("tests", [])
             for i, test in enumerate(test_cases, 1):
-                rows.append([f"Test {i} Status", test.get("status", "Unknown")])
-                if "time_msecs" in test:
-                    rows.append([f"Test {i} Time", f"{test['time_msecs']} ms"])
-                if "memory_bytes" in test:
-                    memory_mb = test["memory_bytes"] / (1024 * 1024)
-                    rows.append([f"Test {i} Memory", f"{memory_mb:.2f} MB"])
-                if "message" in test:
-                    rows.append([f"Test {i} Message", test["message"]])
+                rows.extend(_flatten_test(i, test))
 
         ctx.display_table(headers, rows)
 
@@ -80,25 +140,34 @@ def status(ctx: Context, submission_id: int, watch: bool, interval: int):
         else:
             # Watch mode - poll until submission is complete
             ctx.display_message("Watching submission status (Ctrl+C to stop)...")
-            completed_statuses = {
-                "accepted",
-                "wrong_answer",
-                "compile_error",
-                "runtime_error",
-                "time_limit_exceeded",
-                "memory_limit_exceeded",
-                "system_error",
-            }
-
+            is_tty = sys.stdout.isatty()
+            etag = None
+            delay = interval
             while True:
-                submission = ctx.api_client.get_submission(submission_id)
-                click.clear()  # Clear terminal
+                # Conditional GET: with the previous ETag the server can
+                # answer 304 and skip the body when nothing changed
+                submission, etag = ctx.api_client.get_submission_if_changed(
+                    submission_id, etag
+                )
+
+                if submission is None:
+                    # Unchanged; back off up to 8x the base interval so
+                    # slow judges see fewer requests
+                    delay = min(delay * 2, interval * 8)
+                    time.sleep(delay)
+                    continue
+                delay = interval
+
+                if is_tty:
+                    # Clearing only makes sense on a terminal; piped
+                    # output would just collect ANSI escapes
+                    click.clear()
                 display_status(submission)
 
-                if submission.status.value in completed_statuses:
+                if submission.status.value in _COMPLETED_STATUSES:
                     break
 
-                time.sleep(interval)
+                time.sleep(delay)
 
     except KeyboardInterrupt:
         ctx.display_message("Stopped watching submission status.")
@@ -121,8 +190,7 @@ def list(
 ):
     """List your recent submissions."""
     try:
-        profile: Profile = ctx.api_client.get_profile()
-        username = profile.username
+        username = ctx.username
 
         # Build query parameters
         params = {
@@ -140,41 +208,8 @@ def list(
             ctx.display_message("No submissions found.")
             return
 
-        headers = [
-            "ID",
-            "Problem ID",
-            "Problem Title",
-            "Language",
-            "Status",
-            "Created At",
-        ]
-        rows = []
-        for sub in submissions:
-            problem_id = (
-                str(sub.problem.id) if sub.problem and sub.problem.id else "N/A"
-            )
-            problem_title = (
-                sub.problem.title if sub.problem and sub.problem.title else "N/A"
-            )
-            status_text = sub.status.value if sub.status else "N/A"
-            language_text = sub.language.value if sub.language else "N/A"
-            created_at = (
-                sub.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                if sub.created_at
-                else "N/A"
-            )
-            rows.append(
-                [
-                    sub.id,
-                    problem_id,
-                    problem_title,
-                    language_text,
-                    status_text,
-                    created_at,
-                ]
-            )
-
-        ctx.display_table(headers, rows)
+        rows = [_submission_row(sub) for sub in submissions]
+        ctx.display_table(_SUBMISSION_HEADERS, rows)
 
         if cursor:
             ctx.display_message(f"Next cursor: {cursor}")
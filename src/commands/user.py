@@ -5,6 +5,7 @@ User related commands.
 import click
 
 from ..context import Context
+from .course import _format_dt
 
 
 @click.group()
@@ -40,6 +41,54 @@ def courses(ctx: Context):
         ctx.display_message(f"Failed to fetch courses: {str(e)}")
 
 
+@user.command()
+@click.pass_obj
+def dashboard(ctx: Context):
+    """Show enrolled courses and problemsets in one view."""
+    try:
+        # Both lists arrive from one concurrent batch
+        courses, problemsets = ctx.api_client.get_user_dashboard()
+
+        if courses:
+            ctx.display_message("Enrolled courses:")
+            headers = ["ID", "Name", "Term", "Description"]
+            rows = [
+                [
+                    course.id,
+                    course.name,
+                    course.term.name if course.term else "",
+                    course.description or "",
+                ]
+                for course in courses
+            ]
+            ctx.display_table(headers, rows)
+        else:
+            ctx.display_message("You are not enrolled in any courses.")
+
+        if problemsets:
+            ctx.display_message("Enrolled problemsets:")
+            headers = ["ID", "Type", "Name", "Course", "Period"]
+            rows = [
+                [
+                    ps.id,
+                    ps.type.value.title() if ps.type else "Unknown",
+                    ps.name,
+                    ps.course.name if ps.course else "",
+                    (
+                        f"{_format_dt(ps.start_time)} to {_format_dt(ps.end_time)}"
+                        if ps.start_time and ps.end_time
+                        else ""
+                    ),
+                ]
+                for ps in problemsets
+            ]
+            ctx.display_table(headers, rows)
+        else:
+            ctx.display_message("You are not enrolled in any problemsets.")
+    except Exception as e:
+        ctx.display_message(f"Failed to fetch dashboard: {str(e)}")
+
+
 @user.command()
 @click.pass_obj
 def problemsets(ctx: Context):
@@ -56,7 +105,7 @@ def problemsets(ctx: Context):
         for ps in problemsets:
             ps_type = ps.type.value.title() if ps.type else "Unknown"
             period = (
-                f"{ps.start_time} to {ps.end_time}"
+                f"{_format_dt(ps.start_time)} to {_format_dt(ps.end_time)}"
                 if ps.start_time and ps.end_time
                 else ""
             )
@@ -2,12 +2,76 @@
 Configuration management for the ACM-OJ CLI tool.
 """
 
+import atexit
 import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Parsed config bodies keyed by path, tagged with the file's mtime so a
+# change on disk invalidates the entry. Repeated Config() constructions
+# in one process (commands, tests) then skip the open+parse entirely.
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict]] = {}
+
+# Logging handlers are process-wide; attaching them once is enough no
+# matter how many Config instances get built.
+_LOGGING_INITIALIZED = False
+
+# Directories already created this process; mkdir syscalls are skipped
+# on every Config construction and save after the first.
+_DIRS_ENSURED: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` once per process, remembering it afterwards."""
+    if path not in _DIRS_ENSURED:
+        path.mkdir(exist_ok=True)
+        _DIRS_ENSURED.add(path)
+
+
+class _FastFormatter(logging.Formatter):
+    """Formatter with the record layout baked into an f-string.
+
+    The stock formatMessage runs a %-style interpolation against the
+    format string for every record; the layout here is fixed, so direct
+    attribute access is enough. Keeping the %-format in __init__ makes
+    usesTime() still report True, so asctime is populated as usual.
+    """
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def formatMessage(self, record) -> str:
+        return (
+            f"{record.asctime} - {record.name} - "
+            f"{record.levelname} - {record.message}"
+        )
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler without the per-record filesystem stat.
+
+    The stock shouldRollover stats the log file for every emitted
+    record; the open stream's own position already tells us the size,
+    so the rollover check can stay entirely in memory.
+    """
+
+    def shouldRollover(self, record) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        msg = "%s\n" % self.format(record)
+        self.stream.seek(0, 2)
+        return self.stream.tell() + len(msg) >= self.maxBytes
 
 
 class Config:
@@ -18,32 +82,53 @@ class Config:
         self.config_dir = Path.home() / ".termoj"
         self.config_file = self.config_dir / "config.json"
         self.logs_dir = self.config_dir / "logs"
+        # Plain-string forms for open()/os.replace(); converting the
+        # Path objects once here avoids re-running __fspath__ on every
+        # load and save
+        self._config_file_str = os.fspath(self.config_file)
+        self._tmp_file_str = self._config_file_str + ".tmp"
         self._config: Dict = {
             "token": None,
             "display_mode": "rich",
         }
+        # Write-coalescing state for batch_updates()
+        self._batching = 0
+        self._dirty = False
         # Create config directory first
-        self.config_dir.mkdir(exist_ok=True)
+        _ensure_dir(self.config_dir)
         self._load_config()
         self._setup_logging()
 
     def _setup_logging(self):
-        """Set up logging configuration."""
-        self.logs_dir.mkdir(exist_ok=True)
+        """Set up logging configuration (once per process)."""
+        global _LOGGING_INITIALIZED
+        if _LOGGING_INITIALIZED:
+            return
+        _LOGGING_INITIALIZED = True
+
+        _ensure_dir(self.logs_dir)
         log_file = self.logs_dir / "acm_oj.log"
 
         # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        formatter = _FastFormatter()
 
         # Create file handler
-        file_handler = RotatingFileHandler(
+        file_handler = _FastRotatingFileHandler(
             log_file, maxBytes=1024 * 1024, backupCount=3  # 1MB
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.INFO)
 
+        # Buffer records in memory and hand them to the file handler in
+        # batches; warnings and errors still flush immediately.
+        buffered_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        atexit.register(buffered_handler.flush)
+
         # Create console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
@@ -52,20 +137,66 @@ class Config:
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.INFO)
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(buffered_handler)
         root_logger.addHandler(console_handler)
 
     def _load_config(self):
-        """Load configuration from file."""
-        if self.config_file.exists():
-            with open(self.config_file, "r") as f:
+        """Load configuration from file, reusing the in-memory cache."""
+        if not self.config_file.exists():
+            return
+        mtime_ns = self.config_file.stat().st_mtime_ns
+        cached = _CONFIG_CACHE.get(self.config_file)
+        if cached is not None and cached[0] == mtime_ns:
+            self._config = dict(cached[1])
+            return
+        if orjson is not None:
+            with open(self._config_file_str, "rb") as f:
+                self._config = orjson.loads(f.read())
+        else:
+            with open(self._config_file_str, "r") as f:
                 self._config = json.load(f)
+        _CONFIG_CACHE[self.config_file] = (mtime_ns, dict(self._config))
+
+    def _persist(self):
+        """Save now, or mark dirty while inside batch_updates()."""
+        if self._batching:
+            self._dirty = True
+        else:
+            self._save_config()
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Coalesce several setting changes into one write.
+
+        Within the block, setters only mark the config dirty; the file
+        is written once on exit instead of once per attribute.
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching and self._dirty:
+                self._save_config()
+                self._dirty = False
 
     def _save_config(self):
-        """Save current configuration to file."""
-        self.config_dir.mkdir(exist_ok=True)
-        with open(self.config_file, "w") as f:
-            json.dump(self._config, f, indent=2)
+        """Save current configuration to file atomically."""
+        _ensure_dir(self.config_dir)
+        # Write to a sibling temp file and rename into place so a crash
+        # mid-write can never leave a truncated config behind
+        if orjson is not None:
+            with open(self._tmp_file_str, "wb") as f:
+                f.write(orjson.dumps(self._config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self._tmp_file_str, "w") as f:
+                json.dump(self._config, f, indent=2)
+        os.replace(self._tmp_file_str, self._config_file_str)
+        _CONFIG_CACHE[self.config_file] = (
+            self.config_file.stat().st_mtime_ns,
+            dict(self._config),
+        )
 
     @property
     def token(self) -> Optional[str]:
@@ -76,7 +207,18 @@ class Config:
     def token(self, value: Optional[str]):
         """Store authentication token."""
         self._config["token"] = value
-        self._save_config()
+        self._persist()
+
+    @property
+    def serve_stale_on_error(self) -> bool:
+        """Whether to serve stale cached responses when the API is unreachable."""
+        return self._config.get("serve_stale_on_error", True)
+
+    @serve_stale_on_error.setter
+    def serve_stale_on_error(self, value: bool) -> None:
+        """Enable or disable serving stale cached responses."""
+        self._config["serve_stale_on_error"] = bool(value)
+        self._persist()
 
     @property
     def display_mode(self) -> str:
@@ -89,4 +231,4 @@ class Config:
         if mode not in ["plain", "rich", "cartoon"]:
             raise ValueError(f"Invalid display mode: {mode}")
         self._config["display_mode"] = mode
-        self._save_config()
+        self._persist()
@@ -2,7 +2,7 @@
 Context management for the CLI tool.
 """
 
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 from .api_client import APIClient
 from .config import Config
@@ -12,12 +12,48 @@ from .ui_controller import UIController
 class Context:
     """Context object to share state between CLI commands."""
 
+    # Fixed attribute set: no per-instance __dict__, and config/ui are
+    # built lazily so commands that never render or read settings skip
+    # their construction entirely.
+    __slots__ = ("_config", "_ui", "_api_client", "_username")
+
     def __init__(self):
-        self.config = Config()
-        self.api_client: Optional[APIClient] = None
-        self.ui = UIController(self.config.display_mode)
+        self._config: Optional[Config] = None
+        self._ui: Optional[UIController] = None
+        self._api_client: Optional[APIClient] = None
+        self._username: Optional[str] = None
+
+    @property
+    def config(self) -> Config:
+        """Configuration, loaded on first access."""
+        if self._config is None:
+            self._config = Config()
+        return self._config
+
+    @property
+    def ui(self) -> UIController:
+        """UI controller, built on first access from the configured mode."""
+        if self._ui is None:
+            self._ui = UIController(self.config.display_mode)
+        return self._ui
+
+    @property
+    def api_client(self) -> Optional[APIClient]:
+        """API client, assigned by the CLI entry point."""
+        return self._api_client
+
+    @api_client.setter
+    def api_client(self, client: Optional[APIClient]) -> None:
+        self._api_client = client
+
+    @property
+    def username(self) -> Optional[str]:
+        """Current user's username, fetched from the profile once."""
+        if self._username is None:
+            self._username = self.api_client.get_profile().username
+        return self._username
 
-    def display_table(self, headers: List[str], rows: List[List[Any]]) -> None:
+    def display_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
         """Display data in tabular format using current display mode."""
         self.ui.display_table(headers, rows)
 
@@ -2,8 +2,11 @@
 UI controller for the ACM-OJ CLI tool.
 """
 
+import functools
+import itertools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from rich import print as rich_print
 from rich.console import Console
@@ -13,10 +16,58 @@ from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
+# Rows per rich Table render. Chunking bounds peak memory to one window
+# and gets the first rows on screen before the full set is processed.
+_BATCH = 500
+
+
+# Longest cell content shown before truncation; keeps rich's per-cell
+# measurement bounded when descriptions run to paragraphs.
+_MAX_CELL_CHARS = 120
+
+
+# Style and emoji tables are identical for every strategy instance;
+# build them once and share read-only views.
+_STYLES = MappingProxyType(
+    {
+        "success": "green",
+        "error": "red",
+        "warning": "yellow",
+        "info": "blue",
+    }
+)
+
+_EMOJIS = MappingProxyType(
+    {"success": "✨", "error": "💥", "info": "💡", "warning": "⚠️"}
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Shared Console; terminal probing happens once per process."""
+    return Console()
+
+
+def _truncate(text: str, limit: int = _MAX_CELL_CHARS) -> str:
+    """Clip cell text to ``limit`` characters with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1] + "…"
+
+
+def _batched(rows: Iterable[List[Any]], size: int) -> Iterator[List[List[Any]]]:
+    """Yield lists of up to ``size`` rows from any iterable."""
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 
 class DisplayStrategy(ABC):
     @abstractmethod
-    def display_table(self, headers: List[str], rows: List[List[Any]]) -> None:
+    def display_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
         pass
 
     @abstractmethod
@@ -25,21 +76,31 @@ class DisplayStrategy(ABC):
 
 
 class PlainDisplay(DisplayStrategy):
-    def display_table(self, headers: List[str], rows: List[List[Any]]) -> None:
-        # Simple ASCII table
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
-
-        # Print headers
-        header_row = " | ".join(h.ljust(w) for h, w in zip(headers, col_widths))
-        print(header_row)
-        print("-" * len(header_row))
-
-        # Print rows
-        for row in rows:
-            print(" | ".join(str(cell).ljust(w) for cell, w in zip(row, col_widths)))
+    def display_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
+        # Stringify once; the same strings serve the width pass and the
+        # render pass. Column widths need a full pass, so generator
+        # input is materialized here.
+        str_rows = [[str(cell) for cell in row] for row in rows]
+        if not str_rows:
+            # Nothing to show; callers report empty result sets with
+            # their own messages
+            return
+
+        # Simple ASCII table: one max() per column over the transposed rows
+        col_widths = [
+            max((len(cell) for cell in column), default=0)
+            for column in zip(headers, *str_rows)
+        ]
+
+        # Compile the padding into one format string so each row is a
+        # single format() call instead of a zip of per-cell ljust calls
+        row_fmt = " | ".join(f"{{:<{w}}}" for w in col_widths)
+
+        header_row = row_fmt.format(*headers)
+        lines = [header_row, "-" * len(header_row)]
+        lines.extend(row_fmt.format(*row) for row in str_rows)
+        # Single write instead of one print (and flush) per row
+        print("\n".join(lines))
 
     def display_message(self, message: str, style: Optional[str] = None) -> None:
         print(message)
@@ -47,68 +108,71 @@ class PlainDisplay(DisplayStrategy):
 
 class RichDisplay(DisplayStrategy):
     def __init__(self):
-        self.console = Console()
-        self.styles = {
-            "success": "green",
-            "error": "red",
-            "warning": "yellow",
-            "info": "blue",
-        }
-
-    def display_table(self, headers: List[str], rows: List[List[Any]]) -> None:
-        table = Table()
-        for header in headers:
-            table.add_column(header)
-        for row in rows:
-            table.add_row(*[str(cell) for cell in row])
-        self.console.print(table)
+        self.console = _get_console()
+        self.styles = _STYLES
+
+    def display_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
+        for batch in _batched(rows, _BATCH):
+            table = Table()
+            for header in headers:
+                table.add_column(header)
+            for row in batch:
+                table.add_row(*[_truncate(str(cell)) for cell in row])
+            self.console.print(table)
 
     def display_message(self, message: str, style: Optional[str] = None) -> None:
-        if style in self.styles:
-            self.console.print(message, style=self.styles[style])
+        # One dict lookup covers both the membership test and the value
+        rich_style = self.styles.get(style)
+        if rich_style is not None:
+            self.console.print(message, style=rich_style)
         else:
             rich_print(message)
 
 
 class CartoonDisplay(DisplayStrategy):
     def __init__(self):
-        self.console = Console()
-        self.emojis = {"success": "✨", "error": "💥", "info": "💡", "warning": "⚠️"}
-
-    def display_table(self, headers: List[str], rows: List[List[Any]]) -> None:
-        table = Table(style="bold magenta")
-        for header in headers:
-            table.add_column(f"🎯 {header}", style="cyan")
-        for row in rows:
-            table.add_row(*[f"✨ {str(cell)}" for cell in row])
-        self.console.print(table)
+        self.console = _get_console()
+        self.emojis = _EMOJIS
+
+    def display_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
+        for batch in _batched(rows, _BATCH):
+            table = Table(style="bold magenta")
+            for header in headers:
+                table.add_column(f"🎯 {header}", style="cyan")
+            for row in batch:
+                table.add_row(*[f"✨ {_truncate(str(cell))}" for cell in row])
+            self.console.print(table)
 
     def display_message(self, message: str, style: Optional[str] = None) -> None:
-        if style == "error":
-            rich_print(f"{self.emojis['error']} {message}")
-        elif style == "warning":
-            rich_print(f"{self.emojis['warning']} {message}")
-        elif style == "success":
-            rich_print(f"{self.emojis['success']} {message}")
-        else:
-            rich_print(f"{self.emojis['info']} {message}")
+        # Single lookup with the info emoji as the fallback replaces the
+        # old comparison ladder
+        rich_print(f"{self.emojis.get(style, self.emojis['info'])} {message}")
 
 
 class UIController:
+    # Factories, not instances: only the selected strategy is ever
+    # built, so the unused ones never construct a Console or probe the
+    # terminal.
+    display_strategies = {
+        "plain": PlainDisplay,
+        "rich": RichDisplay,
+        "cartoon": CartoonDisplay,
+    }
+
     def __init__(self, display_mode: str = "plain"):
-        self.display_strategies = {
-            "plain": PlainDisplay(),
-            "rich": RichDisplay(),
-            "cartoon": CartoonDisplay(),
-        }
+        self._instances: Dict[str, DisplayStrategy] = {}
         self.set_display_mode(display_mode)
 
     def set_display_mode(self, mode: str) -> None:
-        if mode not in self.display_strategies:
+        factory = self.display_strategies.get(mode)
+        if factory is None:
             raise ValueError(f"Invalid display mode: {mode}")
-        self.current_strategy = self.display_strategies[mode]
+        strategy = self._instances.get(mode)
+        if strategy is None:
+            strategy = self._instances[mode] = factory()
+        self.current_strategy = strategy
 
-    def display_table(self, headers: List[str], rows: List[List[Any]]) -> None:
+    def display_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
         self.current_strategy.display_table(headers, rows)
 
     def display_message(self, message: str, style: Optional[str] = None) -> None:
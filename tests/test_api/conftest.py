@@ -1,19 +1,80 @@
 """Shared configuration for pytest"""
 
-from datetime import datetime
-from unittest.mock import Mock, patch
+import copy
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 import requests
 
 from src.api_client import APIClient
+from src.models import Submission, SubmissionLanguage, SubmissionStatus
+from tests.test_api import stubs
 
 
-@pytest.fixture
-def api_client():
+@pytest.fixture(scope="session")
+def _api_client_template():
+    """One fully constructed client for the whole session.
+
+    Building an APIClient sets up the session, adapter and config; doing
+    that once and copying per test removes the repeated construction cost.
+    """
     return APIClient()
 
 
+@pytest.fixture
+def api_client(_api_client_template):
+    """Per-test shallow copy of the session-scoped client template.
+
+    Tests only read attributes and call methods whose network layer is
+    patched, so a shallow copy is enough isolation.
+    """
+    return copy.copy(_api_client_template)
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Patch the session's HTTP verbs once for the test.
+
+    monkeypatch teardown is cheaper than stacking unittest.mock.patch
+    decorators on every test; tests drive mock_http.get / mock_http.post
+    directly.
+    """
+    get = Mock()
+    post = Mock()
+    monkeypatch.setattr("requests.Session.get", get)
+    monkeypatch.setattr("requests.Session.post", post)
+    return SimpleNamespace(get=get, post=post)
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """Factory for lightweight response stubs (see stubs.make_response)."""
+    return stubs.make_response
+
+
+@pytest.fixture(scope="session")
+def sample_submission():
+    """Factory for Submission instances built without validation.
+
+    model_construct skips the pydantic validation pass, which is safe
+    here because the keyword data is written by hand; use it when a test
+    just needs a real Submission to pass around, not to prove parsing.
+    """
+
+    def _build(**overrides):
+        fields = {
+            "id": 42,
+            "friendly_name": "ACM",
+            "language": SubmissionLanguage.cpp,
+            "status": SubmissionStatus.accepted,
+        }
+        fields.update(overrides)
+        return Submission.model_construct(**fields)
+
+    return _build
+
+
 @pytest.fixture
 def mock_response():
     """Create a mock response object."""
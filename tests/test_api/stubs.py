@@ -0,0 +1,31 @@
+"""Lightweight response stubs shared by the API tests."""
+
+import json
+from types import SimpleNamespace
+
+
+def make_response(payload=None, status=200, raise_exc=None, headers=None):
+    """Build a lightweight response stub.
+
+    Mock(spec=requests.Response) introspects the whole Response class on
+    every construction; the clients only touch status_code, content,
+    headers, json() and raise_for_status(), so a bare namespace is
+    enough. test_response_contract keeps the stubbed attribute set
+    honest.
+
+    When a payload is given, content carries its serialized bytes so the
+    clients take the same bytes-parsing path they use against the live
+    API; json() stays as the fallback for the non-bytes branch.
+    """
+
+    def raise_for_status():
+        if raise_exc is not None:
+            raise raise_exc
+
+    return SimpleNamespace(
+        status_code=status,
+        content=json.dumps(payload).encode() if payload is not None else None,
+        headers=headers or {},
+        json=lambda: payload,
+        raise_for_status=raise_for_status,
+    )
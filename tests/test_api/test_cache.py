@@ -0,0 +1,240 @@
+"""Tests for the response cache and the cached GET plumbing."""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+import requests
+
+from src.api.cache import ResponseCache
+from src.api.problem import ProblemClient
+from src.api.submission import SubmissionClient
+from tests.test_api.stubs import make_response
+
+# Small canonical payloads; the cache stores raw bytes, so what matters
+# here is that the same body round-trips, not its shape.
+_PROBLEMS_PAYLOAD = {"problems": [{"id": 1000, "title": "A+B"}]}
+
+_SUBMISSION_PAYLOAD = {
+    "id": 42,
+    "friendly_name": "ACM",
+    "language": "cpp",
+    "status": "accepted",
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache store backed by a throwaway database file."""
+    return ResponseCache(tmp_path / "cache.db")
+
+
+@pytest.fixture
+def problem_client(api_client, cache):
+    """ProblemClient wired to the throwaway cache.
+
+    Built fresh instead of copied from the template so cache and
+    in-flight state never leak into the session-scoped client.
+    """
+    return ProblemClient(
+        session=api_client.session, config=api_client.config, cache=cache
+    )
+
+
+@pytest.fixture
+def submission_client(api_client, cache):
+    """SubmissionClient wired to the throwaway cache."""
+    return SubmissionClient(
+        session=api_client.session, config=api_client.config, cache=cache
+    )
+
+
+def test_cache_roundtrip(cache):
+    """Test that a stored body is returned unchanged."""
+    cache.set("key", b"body")
+    assert cache.get("key") == b"body"
+    assert cache.get("missing") is None
+
+
+def test_cache_get_respects_max_age(cache, monkeypatch):
+    """Test that entries older than max_age are treated as misses."""
+    cache.set("key", b"body")
+    assert cache.get("key", max_age=3600) == b"body"
+
+    now = time.time()
+    monkeypatch.setattr("src.api.cache.time.time", lambda: now + 7200)
+    assert cache.get("key", max_age=3600) is None
+    # No max_age means no expiry; the body is still there
+    assert cache.get("key") == b"body"
+
+
+def test_cache_touch_refreshes_entry(cache, monkeypatch):
+    """Test that touch makes an expired entry count as fresh again."""
+    cache.set("key", b"body")
+    now = time.time()
+    monkeypatch.setattr("src.api.cache.time.time", lambda: now + 7200)
+    assert cache.get("key", max_age=3600) is None
+
+    cache.touch("key")
+    assert cache.get("key", max_age=3600) == b"body"
+
+
+def test_cache_get_stale_returns_validators(cache):
+    """Test that get_stale ignores age and includes the HTTP validators."""
+    cache.set("key", b"body", etag='W/"abc"', last_modified="yesterday")
+    assert cache.get_stale("key") == (b"body", 'W/"abc"', "yesterday")
+    assert cache.get_stale("missing") is None
+
+
+def test_cache_clear(cache):
+    """Test that clear drops every entry."""
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+
+def test_cache_persists_across_reopen(tmp_path):
+    """Test that a second store on the same file sees earlier entries."""
+    path = tmp_path / "cache.db"
+    ResponseCache(path).set("key", b"body")
+    assert ResponseCache(path).get("key") == b"body"
+
+
+def test_cache_usable_from_worker_threads(cache):
+    """Test that the store works off the thread that constructed it."""
+
+    def worker():
+        cache.set("key", b"body")
+        return cache.get("key")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(worker).result() == b"body"
+
+
+def test_make_key_sorts_params():
+    """Test that make_key is order-insensitive over the params."""
+    url = "https://example.test/resource"
+    assert ResponseCache.make_key(url) == url
+    assert (
+        ResponseCache.make_key(url, {"b": 2, "a": 1})
+        == ResponseCache.make_key(url, {"a": 1, "b": 2})
+        == f"{url}?a=1&b=2"
+    )
+
+
+def test_cached_get_serves_fresh_hit_without_network(
+    mock_http, problem_client, make_response
+):
+    """Test that a second call within the TTL never touches the network."""
+    mock_http.get.return_value = make_response(_PROBLEMS_PAYLOAD)
+
+    first = problem_client.get_problems()
+    second = problem_client.get_problems()
+
+    mock_http.get.assert_called_once()
+    assert [p.model_dump() for p in second] == [p.model_dump() for p in first]
+
+
+def test_cached_get_revalidates_expired_entry(
+    mock_http, problem_client, make_response, monkeypatch
+):
+    """Test that an expired entry is revalidated and revived by a 304."""
+    mock_http.get.return_value = make_response(
+        _PROBLEMS_PAYLOAD, headers={"ETag": 'W/"abc"'}
+    )
+    problem_client.get_problems()
+
+    now = time.time()
+    monkeypatch.setattr("src.api.cache.time.time", lambda: now + 3600)
+    mock_http.get.return_value = make_response(status=304)
+    result = problem_client.get_problems()
+
+    assert [p.id for p in result] == [1000]
+    assert mock_http.get.call_count == 2
+    # The expired entry's validator rode along on the conditional GET
+    assert mock_http.get.call_args.kwargs["headers"] == {"If-None-Match": 'W/"abc"'}
+
+    # The 304 re-freshened the entry, so the next call is served locally
+    problem_client.get_problems()
+    assert mock_http.get.call_count == 2
+
+
+def test_cached_get_serves_stale_on_connection_error(
+    mock_http, problem_client, make_response, monkeypatch
+):
+    """Test that an unreachable API falls back to the stale cached body."""
+    mock_http.get.return_value = make_response(_PROBLEMS_PAYLOAD)
+    problem_client.get_problems()
+
+    now = time.time()
+    monkeypatch.setattr("src.api.cache.time.time", lambda: now + 3600)
+    monkeypatch.setitem(problem_client.config._config, "serve_stale_on_error", True)
+    mock_http.get.side_effect = requests.exceptions.ConnectionError()
+
+    result = problem_client.get_problems()
+    assert [p.id for p in result] == [1000]
+
+
+def test_cached_get_raises_when_stale_fallback_disabled(
+    mock_http, problem_client, make_response, monkeypatch
+):
+    """Test that the network error propagates when the fallback is off."""
+    mock_http.get.return_value = make_response(_PROBLEMS_PAYLOAD)
+    problem_client.get_problems()
+
+    now = time.time()
+    monkeypatch.setattr("src.api.cache.time.time", lambda: now + 3600)
+    monkeypatch.setitem(problem_client.config._config, "serve_stale_on_error", False)
+    mock_http.get.side_effect = requests.exceptions.ConnectionError()
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        problem_client.get_problems()
+
+
+def test_finished_submission_cached_without_expiry(
+    mock_http, submission_client, make_response
+):
+    """Test that a finished submission is served from cache afterwards."""
+    mock_http.get.return_value = make_response(_SUBMISSION_PAYLOAD)
+
+    first = submission_client.get_submission(42)
+    second = submission_client.get_submission(42)
+
+    mock_http.get.assert_called_once()
+    assert second.model_dump() == first.model_dump()
+
+
+def test_active_submission_not_cached(mock_http, submission_client, make_response):
+    """Test that a still-judging submission is re-fetched every time."""
+    mock_http.get.return_value = make_response(
+        {**_SUBMISSION_PAYLOAD, "status": "judging"}
+    )
+
+    submission_client.get_submission(42)
+    submission_client.get_submission(42)
+    assert mock_http.get.call_count == 2
+
+
+def test_coalesced_get_reuses_inflight_response(
+    mock_http, problem_client, make_response
+):
+    """Test that a request joining an in-flight GET shares its response."""
+    shared = make_response(_PROBLEMS_PAYLOAD)
+    future = Future()
+    future.set_result(shared)
+    problem_client._inflight[(problem_client._resource_url, None)] = future
+
+    assert problem_client._get_coalesced(problem_client._resource_url) is shared
+    mock_http.get.assert_not_called()
+
+
+def test_coalesced_get_cleans_up_after_itself(mock_http, problem_client, make_response):
+    """Test that the owning request removes its in-flight entry."""
+    mock_http.get.return_value = make_response(_PROBLEMS_PAYLOAD)
+
+    response = problem_client._get_coalesced(problem_client._resource_url)
+    assert response.status_code == 200
+    assert problem_client._inflight == {}
+    mock_http.get.assert_called_once()
@@ -1,134 +1,152 @@
 """Tests for the Problem API client."""
 
-from unittest.mock import Mock, patch
-
 import pytest
 import requests
 
-from src.api_client import APIClient
+from src.api.base import BaseAPIClient
 from src.models import Problem, ProblemBrief, Submission, SubmissionLanguage
-
-
-@pytest.fixture
-def api_client():
-    """Create an API client instance for testing."""
-    return APIClient()
-
-
-@patch("requests.Session.get")
-def test_get_problems_no_filters(mock_get, api_client):
+from tests.test_api.stubs import make_response
+
+# Endpoint URL interpolated once at import instead of inside every assert
+_PROBLEM_URL = f"{BaseAPIClient.base_url}/problem/"
+
+# Canonical responses shared across tests, built once at module import.
+_HTTP_ERROR = requests.exceptions.HTTPError()
+_RESP_EMPTY_PROBLEMS = make_response({"problems": []})
+
+_RESP_NOT_FOUND = make_response(status=404, raise_exc=_HTTP_ERROR)
+
+_RESP_BAD_REQUEST = make_response(status=400, raise_exc=_HTTP_ERROR)
+
+# Large payload literals built once at import; tests reference them
+# instead of reconstructing the nested dicts on every run.
+_PROBLEM_PAYLOAD = {
+    "id": 1000,
+    "title": "A+B",
+    "description": "string",
+    "input": "string",
+    "output": "string",
+    "examples": [
+        {
+            "name": "string",
+            "input": "string",
+            "output": "string",
+            "description": "string",
+        }
+    ],
+    "example_input": "string",
+    "example_output": "string",
+    "data_range": "string",
+    "languages_accepted": ["cpp"],
+    "allow_public_submissions": True,
+}
+
+_PROBLEM_FULL_PAYLOAD = {
+    "id": 1000,
+    "title": "A+B",
+    "description": "Calculate A+B",
+    "input": "Two integers A and B",
+    "output": "One integer",
+    "examples": [
+        {
+            "name": "Example 1",
+            "input": "1 2",
+            "output": "3",
+            "description": "Basic case",
+        },
+        {
+            "name": "Example 2",
+            "input": "-1 1",
+            "output": "0",
+            "description": "Negative numbers",
+        },
+    ],
+    "example_input": "Sample input",
+    "example_output": "Sample output",
+    "data_range": "1 ≤ A, B ≤ 100",
+    "languages_accepted": ["cpp", "python", "git"],
+    "allow_public_submissions": True,
+}
+
+# Validated form of _PROBLEM_FULL_PAYLOAD: identical except the accepted
+# languages decode to enums. One dict compare covers every field.
+_EXPECTED_PROBLEM = {
+    **_PROBLEM_FULL_PAYLOAD,
+    "languages_accepted": [
+        SubmissionLanguage.cpp,
+        SubmissionLanguage.python,
+        SubmissionLanguage.git,
+    ],
+}
+
+
+def test_get_problems_no_filters(mock_http, api_client, make_response):
     """Test getting problems list without filters."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "problems": [
-            {
-                "id": 1000,
-                "title": "A+B",
-                "url": "/OnlineJudge/api/v1/problem/1000",
-                "submit_url": "/OnlineJudge/api/v1/problem/1000/submit",
-                "html_url": "/OnlineJudge/problem/1000",
-            }
-        ]
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(
+        {
+            "problems": [
+                {
+                    "id": 1000,
+                    "title": "A+B",
+                    "url": "/OnlineJudge/api/v1/problem/1000",
+                    "submit_url": "/OnlineJudge/api/v1/problem/1000/submit",
+                    "html_url": "/OnlineJudge/problem/1000",
+                }
+            ]
+        }
+    )
 
     result = api_client.get_problems()
     assert len(result) == 1
     assert isinstance(result[0], ProblemBrief)
     assert result[0].id == 1000
     assert result[0].title == "A+B"
-    mock_get.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/", params={}
-    )
+    mock_http.get.assert_called_once_with(_PROBLEM_URL, params={})
 
 
-@patch("requests.Session.get")
-def test_get_problems_with_keyword(mock_get, api_client):
+def test_get_problems_with_keyword(mock_http, api_client):
     """Test getting problems list with keyword filter."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"problems": []}
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = _RESP_EMPTY_PROBLEMS
 
     api_client.get_problems(keyword="test")
-    mock_get.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/", params={"keyword": "test"}
-    )
+    mock_http.get.assert_called_once_with(_PROBLEM_URL, params={"keyword": "test"})
 
 
-@patch("requests.Session.get")
-def test_get_problems_with_problemset(mock_get, api_client):
+def test_get_problems_with_problemset(mock_http, api_client):
     """Test getting problems list with problemset filter."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"problems": []}
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = _RESP_EMPTY_PROBLEMS
 
     api_client.get_problems(problemset_id=42)
-    mock_get.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/", params={"problemset_id": 42}
-    )
+    mock_http.get.assert_called_once_with(_PROBLEM_URL, params={"problemset_id": 42})
 
 
-@patch("requests.Session.get")
-def test_get_problems_with_cursor(mock_get, api_client):
+def test_get_problems_with_cursor(mock_http, api_client, make_response):
     """Test getting problems list with cursor pagination."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "problems": [],
-        "next": "/OnlineJudge/api/v1/problem/?cursor=42",
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(
+        {
+            "problems": [],
+            "next": "/OnlineJudge/api/v1/problem/?cursor=42",
+        }
+    )
 
     api_client.get_problems(cursor=42)
-    mock_get.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/", params={"cursor": 42}
-    )
+    mock_http.get.assert_called_once_with(_PROBLEM_URL, params={"cursor": 42})
 
 
-@patch("requests.Session.get")
-def test_get_problems_with_all_filters(mock_get, api_client):
+def test_get_problems_with_all_filters(mock_http, api_client):
     """Test getting problems list with all filters."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"problems": []}
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = _RESP_EMPTY_PROBLEMS
 
     api_client.get_problems(keyword="test", problemset_id=42, cursor=10)
-    mock_get.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/",
+    mock_http.get.assert_called_once_with(
+        _PROBLEM_URL,
         params={"keyword": "test", "problemset_id": 42, "cursor": 10},
     )
 
 
-@patch("requests.Session.get")
-def test_get_problem_detail(mock_get, api_client):
+def test_get_problem_detail(mock_http, api_client, make_response):
     """Test getting problem details."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": 1000,
-        "title": "A+B",
-        "description": "string",
-        "input": "string",
-        "output": "string",
-        "examples": [
-            {
-                "name": "string",
-                "input": "string",
-                "output": "string",
-                "description": "string",
-            }
-        ],
-        "example_input": "string",
-        "example_output": "string",
-        "data_range": "string",
-        "languages_accepted": ["cpp"],
-        "allow_public_submissions": True,
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(_PROBLEM_PAYLOAD)
 
     result = api_client.get_problem(1000)
     assert isinstance(result, Problem)
@@ -137,23 +155,22 @@ def test_get_problem_detail(mock_get, api_client):
     assert result.description == "string"
     assert len(result.examples) == 1
     assert SubmissionLanguage.cpp in result.languages_accepted
-    mock_get.assert_called_once_with(f"{api_client.problem.base_url}/problem/1000")
+    mock_http.get.assert_called_once_with(f"{_PROBLEM_URL}1000")
 
 
-@patch("requests.Session.post")
-def test_submit_solution_private(mock_post, api_client):
+def test_submit_solution_private(mock_http, api_client, make_response):
     """Test submitting a private solution."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 201
-    mock_response.json.return_value = {
-        "id": 42,
-        "friendly_name": "ACM",
-        "problem": {"id": 1000, "title": "A+B"},
-        "public": False,
-        "language": "cpp",
-        "status": "pending",
-    }
-    mock_post.return_value = mock_response
+    mock_http.post.return_value = make_response(
+        {
+            "id": 42,
+            "friendly_name": "ACM",
+            "problem": {"id": 1000, "title": "A+B"},
+            "public": False,
+            "language": "cpp",
+            "status": "pending",
+        },
+        status=201,
+    )
 
     code = """
     #include <stdio.h>
@@ -169,26 +186,25 @@ def test_submit_solution_private(mock_post, api_client):
     assert result.id == 42
     assert result.language == SubmissionLanguage.cpp
     assert result.public == False
-    mock_post.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/1000/submit",
+    mock_http.post.assert_called_once_with(
+        f"{_PROBLEM_URL}1000/submit",
         data={"language": "cpp", "code": code, "public": False},
     )
 
 
-@patch("requests.Session.post")
-def test_submit_solution_public(mock_post, api_client):
+def test_submit_solution_public(mock_http, api_client, make_response):
     """Test submitting a public solution."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 201
-    mock_response.json.return_value = {
-        "id": 42,
-        "friendly_name": "ACM",
-        "problem": {"id": 1000, "title": "A+B"},
-        "public": True,
-        "language": "python",
-        "status": "pending",
-    }
-    mock_post.return_value = mock_response
+    mock_http.post.return_value = make_response(
+        {
+            "id": 42,
+            "friendly_name": "ACM",
+            "problem": {"id": 1000, "title": "A+B"},
+            "public": True,
+            "language": "python",
+            "status": "pending",
+        },
+        status=201,
+    )
 
     code = "print(sum(map(int, input().split())))"
     result = api_client.submit_solution(1000, code, "python", public=True)
@@ -196,91 +212,63 @@ def test_submit_solution_public(mock_post, api_client):
     assert result.id == 42
     assert result.language == SubmissionLanguage.python
     assert result.public == True
-    mock_post.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/1000/submit",
+    mock_http.post.assert_called_once_with(
+        f"{_PROBLEM_URL}1000/submit",
         data={"language": "python", "code": code, "public": True},
     )
 
 
-@patch("requests.Session.get")
-def test_get_problem_not_found(mock_get, api_client):
+def test_get_problem_not_found(mock_http, api_client):
     """Test getting a non-existent problem."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = _RESP_NOT_FOUND
 
     with pytest.raises(Exception):
         api_client.get_problem(99999)
 
 
-@patch("requests.Session.post")
-def test_submit_solution_invalid_language(mock_post, api_client):
+def test_submit_solution_invalid_language(mock_http, api_client):
     """Test submitting a solution with invalid language."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 400
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-    mock_post.return_value = mock_response
+    mock_http.post.return_value = _RESP_BAD_REQUEST
 
     with pytest.raises(Exception):
         api_client.submit_solution(1000, "code", "invalid_lang")
 
 
-@patch("requests.Session.get")
-def test_get_problem_with_all_fields(mock_get, api_client):
+def test_get_problem_with_all_fields(mock_http, api_client, make_response):
     """Test getting problem details with all possible fields."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": 1000,
-        "title": "A+B",
-        "description": "Calculate A+B",
-        "input": "Two integers A and B",
-        "output": "One integer",
-        "examples": [
-            {
-                "name": "Example 1",
-                "input": "1 2",
-                "output": "3",
-                "description": "Basic case",
-            },
-            {
-                "name": "Example 2",
-                "input": "-1 1",
-                "output": "0",
-                "description": "Negative numbers",
-            },
-        ],
-        "example_input": "Sample input",
-        "example_output": "Sample output",
-        "data_range": "1 ≤ A, B ≤ 100",
-        "languages_accepted": ["cpp", "python", "git"],
-        "allow_public_submissions": True,
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(_PROBLEM_FULL_PAYLOAD)
 
     result = api_client.get_problem(1000)
     assert isinstance(result, Problem)
-    assert result.id == 1000
-    assert result.title == "A+B"
-    assert len(result.examples) == 2
-    assert result.data_range == "1 ≤ A, B ≤ 100"
-    assert len(result.languages_accepted) == 3
-    assert result.allow_public_submissions is True
-    mock_get.assert_called_once_with(f"{api_client.problem.base_url}/problem/1000")
+    assert result.model_dump() == _EXPECTED_PROBLEM
+    mock_http.get.assert_called_once_with(f"{_PROBLEM_URL}1000")
 
 
-@patch("requests.Session.get")
-def test_empty_problems_list(mock_get, api_client):
+def test_empty_problems_list(mock_http, api_client):
     """Test handling of empty problems list."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"problems": []}
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = _RESP_EMPTY_PROBLEMS
 
     result = api_client.get_problems()
     assert isinstance(result, list)
     assert len(result) == 0
-    mock_get.assert_called_once_with(
-        f"{api_client.problem.base_url}/problem/", params={}
-    )
+    mock_http.get.assert_called_once_with(_PROBLEM_URL, params={})
+
+
+def test_iter_problems_follows_cursor(mock_http, api_client, make_response):
+    """Test that iter_problems walks pages until there is no next."""
+    mock_http.get.side_effect = [
+        make_response(
+            {
+                "problems": [{"id": 1000, "title": "A+B"}],
+                "next": "/OnlineJudge/api/v1/problem/?cursor=2",
+            }
+        ),
+        make_response({"problems": [{"id": 1001, "title": "A-B"}]}),
+    ]
+
+    result = list(api_client.problem.iter_problems())
+
+    assert [p.id for p in result] == [1000, 1001]
+    assert mock_http.get.call_count == 2
+    # The second page was requested with the cursor from the first's next
+    assert mock_http.get.call_args.kwargs["params"] == {"cursor": "2"}
@@ -1,44 +1,104 @@
 """Tests for the Submission API client."""
 
-from unittest.mock import Mock, patch
-
 import pytest
 import requests
 
-from src.api_client import APIClient
+from src.api.base import BaseAPIClient
 from src.models import Submission, SubmissionBrief, SubmissionLanguage, SubmissionStatus
-
-
-@patch("requests.Session.get")
-def test_get_submission_detail(mock_get, api_client):
+from tests.test_api.stubs import make_response
+
+# Request URLs are fixed by the client; building them once from the class
+# attribute keeps the asserts free of per-test f-string work.
+_SUBMISSION_URL = f"{BaseAPIClient.base_url}/submission/"
+
+# Canonical responses shared across tests, built once at module import.
+_HTTP_ERROR = requests.exceptions.HTTPError()
+_RESP_EMPTY_SUBMISSIONS = make_response({"submissions": []})
+
+_RESP_NO_CONTENT = make_response(status=204)
+
+_RESP_NOT_FOUND = make_response(status=404, raise_exc=_HTTP_ERROR)
+
+_RESP_FORBIDDEN = make_response(status=403, raise_exc=_HTTP_ERROR)
+
+
+# Large payload literals built once at import; tests reference them
+# instead of reconstructing the nested dicts on every run.
+_SUBMISSION_PAYLOAD = {
+    "id": 42,
+    "friendly_name": "ACM",
+    "problem": {
+        "id": 1000,
+        "title": "A+B",
+        "url": "/OnlineJudge/api/v1/problem/42",
+        "submit_url": "/OnlineJudge/api/v1/problem/42/submit",
+        "html_url": "/OnlineJudge/problem/42",
+    },
+    "public": True,
+    "language": "cpp",
+    "score": 100,
+    "message": "string",
+    "details": {},
+    "time_msecs": 2233,
+    "memory_bytes": 1048576,
+    "status": "accepted",
+    "should_show_score": True,
+    "created_at": "2024-12-25T10:12:35.728Z",
+    "code_url": "/OnlineJudge/oj-submissions/42.code?X-Amz-Algorithm=...",
+    "abort_url": "/OnlineJudge/api/v1/submission/42/abort",
+    "html_url": "/OnlineJudge/code/42/",
+}
+
+_SUBMISSIONS_PAYLOAD = {
+    "submissions": [
+        {
+            "id": 42,
+            "friendly_name": "ACM",
+            "problem": {
+                "id": 1000,
+                "title": "A+B",
+                "url": "/OnlineJudge/api/v1/problem/42",
+                "submit_url": "/OnlineJudge/api/v1/problem/42/submit",
+                "html_url": "/OnlineJudge/problem/42",
+            },
+            "status": "accepted",
+            "language": "cpp",
+            "created_at": "2024-12-25T10:15:48.745Z",
+            "url": "/OnlineJudge/api/v1/submission/42",
+            "html_url": "/OnlineJudge/code/42",
+        }
+    ],
+    "next": "/OnlineJudge/api/v1/endpoint?cursor=42",
+}
+
+_SUBMISSION_FULL_PAYLOAD = {
+    "id": 42,
+    "friendly_name": "ACM",
+    "problem": {"id": 1000, "title": "A+B"},
+    "public": True,
+    "language": "cpp",
+    "score": 100,
+    "message": "Accepted",
+    "details": {
+        "testcases": [
+            {"status": "accepted", "time": 0.001, "memory": 1024},
+            {"status": "accepted", "time": 0.002, "memory": 2048},
+        ]
+    },
+    "time_msecs": 2,
+    "memory_bytes": 2048,
+    "status": "accepted",
+    "should_show_score": True,
+    "created_at": "2023-01-01T00:00:00Z",
+    "code_url": "/OnlineJudge/oj-submissions/42.code",
+    "abort_url": "/OnlineJudge/api/v1/submission/42/abort",
+    "html_url": "/OnlineJudge/code/42/",
+}
+
+
+def test_get_submission_detail(mock_http, api_client, make_response):
     """Test getting submission details."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": 42,
-        "friendly_name": "ACM",
-        "problem": {
-            "id": 1000,
-            "title": "A+B",
-            "url": "/OnlineJudge/api/v1/problem/42",
-            "submit_url": "/OnlineJudge/api/v1/problem/42/submit",
-            "html_url": "/OnlineJudge/problem/42",
-        },
-        "public": True,
-        "language": "cpp",
-        "score": 100,
-        "message": "string",
-        "details": {},
-        "time_msecs": 2233,
-        "memory_bytes": 1048576,
-        "status": "accepted",
-        "should_show_score": True,
-        "created_at": "2024-12-25T10:12:35.728Z",
-        "code_url": "/OnlineJudge/oj-submissions/42.code?X-Amz-Algorithm=...",
-        "abort_url": "/OnlineJudge/api/v1/submission/42/abort",
-        "html_url": "/OnlineJudge/code/42/",
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(_SUBMISSION_PAYLOAD)
 
     result = api_client.get_submission(42)
     assert isinstance(result, Submission)
@@ -48,36 +108,12 @@ def test_get_submission_detail(mock_get, api_client):
     assert result.memory_bytes == 1048576
     assert result.should_show_score is True
     assert result.status == SubmissionStatus.accepted
-    mock_get.assert_called_once_with(f"{api_client.submission.base_url}/submission/42")
+    mock_http.get.assert_called_once_with(f"{_SUBMISSION_URL}42")
 
 
-@patch("requests.Session.get")
-def test_get_submissions_no_filters(mock_get, api_client):
+def test_get_submissions_no_filters(mock_http, api_client, make_response):
     """Test getting submissions list without filters."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "submissions": [
-            {
-                "id": 42,
-                "friendly_name": "ACM",
-                "problem": {
-                    "id": 1000,
-                    "title": "A+B",
-                    "url": "/OnlineJudge/api/v1/problem/42",
-                    "submit_url": "/OnlineJudge/api/v1/problem/42/submit",
-                    "html_url": "/OnlineJudge/problem/42",
-                },
-                "status": "accepted",
-                "language": "cpp",
-                "created_at": "2024-12-25T10:15:48.745Z",
-                "url": "/OnlineJudge/api/v1/submission/42",
-                "html_url": "/OnlineJudge/code/42",
-            }
-        ],
-        "next": "/OnlineJudge/api/v1/endpoint?cursor=42",
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(_SUBMISSIONS_PAYLOAD)
 
     result = api_client.get_submissions()
     assert len(result) == 1
@@ -87,205 +123,74 @@ def test_get_submissions_no_filters(mock_get, api_client):
     assert submission.status == SubmissionStatus.accepted
     assert submission.language == SubmissionLanguage.cpp
     assert submission.problem.id == 1000
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={}
-    )
-
-
-@patch("requests.Session.get")
-def test_get_submissions_with_username(mock_get, api_client):
-    """Test getting submissions list filtered by username."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"submissions": []}
-    mock_get.return_value = mock_response
-
-    api_client.get_submissions(username="testuser")
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={"username": "testuser"}
-    )
-
-
-@patch("requests.Session.get")
-def test_get_submissions_with_problem_id(mock_get, api_client):
-    """Test getting submissions list filtered by problem ID."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"submissions": []}
-    mock_get.return_value = mock_response
-
-    api_client.get_submissions(problem_id=1000)
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={"problem_id": 1000}
-    )
-
-
-@patch("requests.Session.get")
-def test_get_submissions_with_status(mock_get, api_client):
-    """Test getting submissions list filtered by status."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"submissions": []}
-    mock_get.return_value = mock_response
-
-    api_client.get_submissions(status="accepted")
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={"status": "accepted"}
-    )
-
-
-@patch("requests.Session.get")
-def test_get_submissions_with_language(mock_get, api_client):
-    """Test getting submissions list filtered by language."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"submissions": []}
-    mock_get.return_value = mock_response
-
-    api_client.get_submissions(lang="cpp")
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={"lang": "cpp"}
-    )
+    mock_http.get.assert_called_once_with(_SUBMISSION_URL, params={})
+
+
+# Each filter is forwarded verbatim as a query parameter, so one dict per
+# case serves as both the call kwargs and the expected params.
+_FILTER_CASES = [
+    {"username": "testuser"},
+    {"problem_id": 1000},
+    {"status": "accepted"},
+    {"lang": "cpp"},
+    {"cursor": "next_page"},
+    {
+        "username": "testuser",
+        "problem_id": 1000,
+        "status": "accepted",
+        "lang": "cpp",
+        "cursor": "next_page",
+    },
+]
 
 
-@patch("requests.Session.get")
-def test_get_submissions_with_cursor(mock_get, api_client):
-    """Test getting submissions list with cursor pagination."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "submissions": [],
-        "next": "/OnlineJudge/api/v1/submission/?cursor=next_page",
-    }
-    mock_get.return_value = mock_response
-
-    api_client.get_submissions(cursor="next_page")
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={"cursor": "next_page"}
-    )
+@pytest.mark.parametrize("filters", _FILTER_CASES)
+def test_get_submissions_filters(filters, mock_http, api_client):
+    """Test that get_submissions forwards each filter as a query param."""
+    mock_http.get.return_value = _RESP_EMPTY_SUBMISSIONS
 
-
-@patch("requests.Session.get")
-def test_get_submissions_with_all_filters(mock_get, api_client):
-    """Test getting submissions list with all filters."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"submissions": []}
-    mock_get.return_value = mock_response
-
-    api_client.get_submissions(
-        username="testuser",
-        problem_id=1000,
-        status="accepted",
-        lang="cpp",
-        cursor="next_page",
-    )
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/",
-        params={
-            "username": "testuser",
-            "problem_id": 1000,
-            "status": "accepted",
-            "lang": "cpp",
-            "cursor": "next_page",
-        },
-    )
+    api_client.get_submissions(**filters)
+    mock_http.get.assert_called_once_with(_SUBMISSION_URL, params=filters)
 
 
-@patch("requests.Session.post")
-def test_abort_submission_success(mock_post, api_client):
+def test_abort_submission_success(mock_http, api_client):
     """Test successfully aborting a submission."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 204
-    mock_post.return_value = mock_response
+    mock_http.post.return_value = _RESP_NO_CONTENT
 
     api_client.abort_submission(42)
-    mock_post.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/42/abort"
-    )
-
-
-@patch("requests.Session.post")
-def test_abort_submission_not_found(mock_post, api_client):
-    """Test aborting a non-existent submission."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-    mock_post.return_value = mock_response
-
-    with pytest.raises(Exception):
-        api_client.abort_submission(99999)
-
-
-@patch("requests.Session.post")
-def test_abort_submission_forbidden(mock_post, api_client):
-    """Test aborting a submission without permission."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 403
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-    mock_post.return_value = mock_response
-
-    with pytest.raises(Exception):
-        api_client.abort_submission(42)
-
-
-@patch("requests.Session.get")
-def test_get_submission_not_found(mock_get, api_client):
-    """Test getting a non-existent submission."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-    mock_get.return_value = mock_response
+    mock_http.post.assert_called_once_with(f"{_SUBMISSION_URL}42/abort")
+
+
+@pytest.mark.parametrize(
+    "verb,response,call",
+    [
+        ("post", _RESP_NOT_FOUND, lambda client: client.abort_submission(99999)),
+        ("post", _RESP_FORBIDDEN, lambda client: client.abort_submission(42)),
+        ("get", _RESP_NOT_FOUND, lambda client: client.get_submission(99999)),
+    ],
+    ids=["abort-not-found", "abort-forbidden", "get-not-found"],
+)
+def test_submission_error_responses(verb, response, call, mock_http, api_client):
+    """Test that HTTP error responses surface as exceptions."""
+    getattr(mock_http, verb).return_value = response
 
     with pytest.raises(Exception):
-        api_client.get_submission(99999)
+        call(api_client)
 
 
-@patch("requests.Session.get")
-def test_empty_submissions_list(mock_get, api_client):
+def test_empty_submissions_list(mock_http, api_client):
     """Test handling of empty submissions list."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"submissions": []}
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = _RESP_EMPTY_SUBMISSIONS
 
     result = api_client.get_submissions()
     assert isinstance(result, list)
     assert len(result) == 0
-    mock_get.assert_called_once_with(
-        f"{api_client.submission.base_url}/submission/", params={}
-    )
+    mock_http.get.assert_called_once_with(_SUBMISSION_URL, params={})
 
 
-@patch("requests.Session.get")
-def test_get_submission_with_all_fields(mock_get, api_client):
+def test_get_submission_with_all_fields(mock_http, api_client, make_response):
     """Test getting submission details with all possible fields."""
-    mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": 42,
-        "friendly_name": "ACM",
-        "problem": {"id": 1000, "title": "A+B"},
-        "public": True,
-        "language": "cpp",
-        "score": 100,
-        "message": "Accepted",
-        "details": {
-            "testcases": [
-                {"status": "accepted", "time": 0.001, "memory": 1024},
-                {"status": "accepted", "time": 0.002, "memory": 2048},
-            ]
-        },
-        "time_msecs": 2,
-        "memory_bytes": 2048,
-        "status": "accepted",
-        "should_show_score": True,
-        "created_at": "2023-01-01T00:00:00Z",
-        "code_url": "/OnlineJudge/oj-submissions/42.code",
-        "abort_url": "/OnlineJudge/api/v1/submission/42/abort",
-        "html_url": "/OnlineJudge/code/42/",
-    }
-    mock_get.return_value = mock_response
+    mock_http.get.return_value = make_response(_SUBMISSION_FULL_PAYLOAD)
 
     result = api_client.get_submission(42)
     assert isinstance(result, Submission)
@@ -299,4 +204,48 @@ def test_get_submission_with_all_fields(mock_get, api_client):
     assert result.should_show_score is True
     assert result.code_url == "/OnlineJudge/oj-submissions/42.code"
     assert result.abort_url == "/OnlineJudge/api/v1/submission/42/abort"
-    mock_get.assert_called_once_with(f"{api_client.submission.base_url}/submission/42")
+    mock_http.get.assert_called_once_with(f"{_SUBMISSION_URL}42")
+
+
+def test_iter_submissions_follows_cursor(mock_http, api_client, make_response):
+    """Test that iter_submissions walks pages until there is no next."""
+    brief = _SUBMISSIONS_PAYLOAD["submissions"][0]
+    mock_http.get.side_effect = [
+        make_response(_SUBMISSIONS_PAYLOAD),
+        make_response({"submissions": [{**brief, "id": 43}]}),
+    ]
+
+    result = list(api_client.submission.iter_submissions())
+
+    assert [s.id for s in result] == [42, 43]
+    assert mock_http.get.call_count == 2
+    # The second page was requested with the cursor from the first's next
+    assert mock_http.get.call_args.kwargs["params"] == {"cursor": "42"}
+
+
+def test_get_submission_if_changed_initial_fetch(mock_http, api_client, make_response):
+    """Test that the first poll returns the submission and its ETag."""
+    mock_http.get.return_value = make_response(
+        _SUBMISSION_PAYLOAD, headers={"ETag": 'W/"v1"'}
+    )
+
+    submission, etag = api_client.submission.get_submission_if_changed(42)
+
+    assert submission.id == 42
+    assert etag == 'W/"v1"'
+    mock_http.get.assert_called_once_with(f"{_SUBMISSION_URL}42")
+
+
+def test_get_submission_if_changed_not_modified(mock_http, api_client, make_response):
+    """Test that a 304 answer short-circuits without parsing a body."""
+    mock_http.get.return_value = make_response(status=304)
+
+    submission, etag = api_client.submission.get_submission_if_changed(
+        42, etag='W/"v1"'
+    )
+
+    assert submission is None
+    assert etag == 'W/"v1"'
+    mock_http.get.assert_called_once_with(
+        f"{_SUBMISSION_URL}42", headers={"If-None-Match": 'W/"v1"'}
+    )
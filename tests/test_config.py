@@ -0,0 +1,71 @@
+"""Tests for configuration management."""
+
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Config rooted in a throwaway home directory."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return Config()
+
+
+@pytest.fixture
+def saves(config, monkeypatch):
+    """Record every _save_config call instead of writing to disk."""
+    calls = []
+    monkeypatch.setattr(config, "_save_config", lambda: calls.append(1))
+    return calls
+
+
+def test_setter_persists_immediately(config, saves):
+    """Test that a setter outside batch_updates saves right away."""
+    config.token = "tok"
+    assert saves == [1]
+
+
+def test_batch_updates_coalesces_writes(config, saves):
+    """Test that several setters inside the block produce one save."""
+    with config.batch_updates():
+        config.token = "tok"
+        config.display_mode = "plain"
+        config.serve_stale_on_error = False
+        assert saves == []
+
+    assert saves == [1]
+    assert config.token == "tok"
+    assert config.display_mode == "plain"
+    assert config.serve_stale_on_error is False
+
+
+def test_batch_updates_skips_write_when_clean(config, saves):
+    """Test that an empty block writes nothing."""
+    with config.batch_updates():
+        pass
+    assert saves == []
+
+
+def test_batch_updates_nested_blocks_write_once(config, saves):
+    """Test that nested blocks defer the save to the outermost exit."""
+    with config.batch_updates():
+        config.token = "tok"
+        with config.batch_updates():
+            config.display_mode = "plain"
+        assert saves == []
+
+    assert saves == [1]
+
+
+def test_batch_updates_round_trips_to_disk(config):
+    """Test that the single write really lands in the config file."""
+    with config.batch_updates():
+        config.token = "tok"
+        config.display_mode = "plain"
+
+    reloaded = Config()
+    assert reloaded.token == "tok"
+    assert reloaded.display_mode == "plain"